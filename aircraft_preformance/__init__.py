@@ -1,4 +1,4 @@
-from pint import UnitRegistry
+from pint import UnitRegistry, set_application_registry
 
 ureg = UnitRegistry()
 
@@ -6,3 +6,7 @@ preferred_units = [ureg.N]  # force
 
 ureg.default_system = "SI"
 ureg.default_preferred_units = preferred_units
+
+# unpickled Quantities, e.g. simulation results returned by worker processes, are
+# attached to the application registry
+set_application_registry(ureg)
@@ -0,0 +1,171 @@
+"""
+Unit-free numeric core of the airspeed conversions in `airspeed.py`.
+
+All functions take and return plain floats in SI units (m/s, m). The `_isa`
+variants take the atmospheric state at the current altitude instead of the altitude,
+either as separate floats or as an `isa_table.AtmState`, so callers that already probed
+the ISA table can reuse it across conversions. The public,
+pint-facing wrappers in `airspeed.py` strip units once at the boundary and call
+into this module, so no `pint.Quantity` arithmetic happens in the hot path. The
+functions are compiled with Numba when it is available (see `_jit.py`). Each scalar
+core has an `_array` counterpart that evaluates it elementwise over 1-D float64
+arrays, as a parallel loop when compiled.
+"""
+
+import math
+
+import numpy as np
+
+from ._jit import njit, prange
+from .isa_table import _isa, a_at, atm_at, p_at, rho_at
+
+# sea level ISA properties, evaluated once at import
+_, _P_SL, _RHO_SL, _A_SL = _isa(0.0)
+_RHO_SL_OVER_P_SL = _RHO_SL / _P_SL
+_P_SL_OVER_RHO_SL = _P_SL / _RHO_SL
+
+# ratio of specific heats for air, gamma = 1.4, enters as gamma / (gamma - 1)
+_GR = 3.5
+_INV_GR = 1 / _GR
+_INV_2GR = 1 / (2 * _GR)
+
+# constant factors of the conversions, folded so that each step is a single a * b + c
+_K_P1_CAS = _INV_2GR * _RHO_SL_OVER_P_SL  # impact pressure term of the CAS [s**2/m**2]
+_K_V_CAS = 2 * _GR * _P_SL_OVER_RHO_SL  # CAS from the pressure ratio term [m**2/s**2]
+_INV_P_SL = 1 / _P_SL
+
+
+@njit(cache=True, fastmath=True)
+def _cas2tas_isa(v_cas, rho_h, p_h):
+    """
+    Convert calibrated airspeed [m/s] to true airspeed [m/s] given the density
+    [kg/m**3] and pressure [Pa] at the current altitude.
+    """
+
+    # compute true airspeed, with p1**3.5 expanded as p1 * p1 * p1 * sqrt(p1) and
+    # the affine steps written as a * b + c so fastmath can contract them into FMAs
+    p1 = _K_P1_CAS * (v_cas * v_cas) + 1.0
+    p2 = (p1 * p1 * p1) * math.sqrt(p1) - 1.0
+    p3 = math.pow((_P_SL / p_h) * p2 + 1.0, _INV_GR)
+    return math.sqrt((2 * _GR) * (p_h / rho_h) * (p3 - 1.0))
+
+
+@njit(cache=True, fastmath=True)
+def _tas2cas_isa(v_tas, rho_h, p_h):
+    """
+    Convert true airspeed [m/s] to calibrated airspeed [m/s] given the density
+    [kg/m**3] and pressure [Pa] at the current altitude.
+    """
+
+    # compute calibrated airspeed, with p1**3.5 expanded as p1 * p1 * p1 * sqrt(p1) and
+    # the affine steps written as a * b + c so fastmath can contract them into FMAs
+    p1 = (_INV_2GR * rho_h / p_h) * (v_tas * v_tas) + 1.0
+    p2 = (p1 * p1 * p1) * math.sqrt(p1) - 1.0
+    p3 = math.pow((p_h * _INV_P_SL) * p2 + 1.0, _INV_GR)
+    return math.sqrt(_K_V_CAS * p3 - _K_V_CAS)
+
+
+@njit(cache=True, fastmath=True)
+def _cas2tas_si(v_cas, h):
+    """
+    Convert calibrated airspeed [m/s] to true airspeed [m/s] at altitude h [m].
+    """
+
+    return _cas2tas_isa(v_cas, rho_at(h), p_at(h))
+
+
+@njit(cache=True, fastmath=True)
+def _tas2cas_si(v_tas, h):
+    """
+    Convert true airspeed [m/s] to calibrated airspeed [m/s] at altitude h [m].
+    """
+
+    return _tas2cas_isa(v_tas, rho_at(h), p_at(h))
+
+
+@njit(cache=True, fastmath=True)
+def _cas2tas_mach_isa(v_cas, atm):
+    """
+    Convert calibrated airspeed [m/s] to true airspeed [m/s] and Mach number given
+    the atmospheric state `atm` at the current altitude.
+    """
+
+    v_tas = _cas2tas_isa(v_cas, atm.rho, atm.p)
+    return v_tas, v_tas / atm.a
+
+
+@njit(cache=True, fastmath=True)
+def _cas2tas_mach_si(v_cas, h):
+    """
+    Convert calibrated airspeed [m/s] to true airspeed [m/s] and Mach number at
+    altitude h [m], probing the ISA table once for both.
+    """
+
+    return _cas2tas_mach_isa(v_cas, atm_at(h))
+
+
+@njit(cache=True, fastmath=True)
+def _cas2mach_si(v_cas, h):
+    """
+    Convert calibrated airspeed [m/s] to Mach number at altitude h [m].
+    """
+
+    return _cas2tas_mach_si(v_cas, h)[1]
+
+
+@njit(cache=True, fastmath=True)
+def _tas2mach_si(v_tas, h):
+    """
+    Convert true airspeed [m/s] to Mach number at altitude h [m].
+    """
+
+    v_sound = a_at(h)
+    return v_tas / v_sound
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _cas2tas_si_array(v_cas, h):
+    """
+    Elementwise `_cas2tas_si` over 1-D arrays of airspeed [m/s] and altitude [m].
+    """
+
+    out = np.empty(v_cas.size)
+    for i in prange(v_cas.size):
+        out[i] = _cas2tas_si(v_cas[i], h[i])
+    return out
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _tas2cas_si_array(v_tas, h):
+    """
+    Elementwise `_tas2cas_si` over 1-D arrays of airspeed [m/s] and altitude [m].
+    """
+
+    out = np.empty(v_tas.size)
+    for i in prange(v_tas.size):
+        out[i] = _tas2cas_si(v_tas[i], h[i])
+    return out
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _cas2mach_si_array(v_cas, h):
+    """
+    Elementwise `_cas2mach_si` over 1-D arrays of airspeed [m/s] and altitude [m].
+    """
+
+    out = np.empty(v_cas.size)
+    for i in prange(v_cas.size):
+        out[i] = _cas2mach_si(v_cas[i], h[i])
+    return out
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _tas2mach_si_array(v_tas, h):
+    """
+    Elementwise `_tas2mach_si` over 1-D arrays of airspeed [m/s] and altitude [m].
+    """
+
+    out = np.empty(v_tas.size)
+    for i in prange(v_tas.size):
+        out[i] = _tas2mach_si(v_tas[i], h[i])
+    return out
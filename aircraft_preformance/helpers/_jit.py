@@ -0,0 +1,38 @@
+"""
+Optional Numba JIT support.
+
+`njit` forwards to `numba.njit` when Numba is installed. Without Numba, or when
+the `NUMBA_DISABLE_JIT=1` environment variable is set, it is a no-op decorator and
+the decorated functions run as plain Python, so Numba stays an optional dependency.
+`prange` is `numba.prange` for loops in `parallel=True` functions, and the builtin
+`range` in the fallback case.
+"""
+
+import os
+
+if os.environ.get("NUMBA_DISABLE_JIT", "0") == "1":
+    _numba_njit = None
+else:
+    try:
+        from numba import njit as _numba_njit
+    except ImportError:
+        _numba_njit = None
+
+if _numba_njit is not None:
+    from numba import prange
+else:
+    prange = range
+
+
+def njit(*args, **kwargs):
+    """
+    Drop-in replacement for `numba.njit`, usable both as `@njit` and `@njit(...)`.
+    """
+
+    if _numba_njit is not None:
+        return _numba_njit(*args, **kwargs)
+
+    # bare `@njit` usage receives the function directly
+    if len(args) == 1 and callable(args[0]) and not kwargs:
+        return args[0]
+    return lambda func: func
@@ -1,8 +1,45 @@
 import numpy as np
 
 from . import ureg
-from .airspeed import cas2tas
-from ambiance import Atmosphere
+from ._airspeed_core import _cas2tas_isa
+from ._jit import njit
+from .isa_table import atm_at
+
+# unit attached to the result, resolved once at import
+_DIMENSIONLESS = ureg("dimensionless")
+
+
+@njit(cache=True, fastmath=True)
+def _c_l_steady_isa(v_cas, atm, w, s):
+    """
+    `_c_l_steady_si` given the atmospheric state `atm` (an `isa_table.AtmState`) at
+    the current altitude instead of the altitude.
+    """
+
+    v_tas = _cas2tas_isa(v_cas, atm.rho, atm.p)
+    return 2.0 * w / (atm.rho * s * v_tas * v_tas)
+
+
+@njit(cache=True, fastmath=True)
+def _c_l_steady_si(v_cas, h, w, s):
+    """
+    SI-float core of `c_l_steady`: CAS in [m/s], altitude in [m], weight in [N]
+    and wing area in [m**2]. Returns the dimensionless lift coefficient.
+    """
+
+    return _c_l_steady_isa(v_cas, atm_at(h), w, s)
+
+
+@njit(cache=True, fastmath=True)
+def _c_l_steady_si_array(v_cas, h, w, s):
+    """
+    Elementwise `_c_l_steady_si` over 1-D float64 arrays.
+    """
+
+    out = np.empty(v_cas.size)
+    for i in range(v_cas.size):
+        out[i] = _c_l_steady_si(v_cas[i], h[i], w[i], s[i])
+    return out
 
 
 def c_l_steady(v_cas, altitude, weight, wing_area):
@@ -16,7 +53,7 @@ def c_l_steady(v_cas, altitude, weight, wing_area):
         wing_area (Quantity): Wing area of the aircraft, typically in units of area (e.g., square meters or square feet).
 
     Returns:
-        Quantity: The steady-state lift coefficient (C_L), a dimensionless value rounded to 4 decimal places.
+        Quantity: The steady-state lift coefficient (C_L), a dimensionless value.
 
     Notes:
         - The lift coefficient is calculated under the assumption of steady flight, where lift equals weight.
@@ -24,18 +61,42 @@ def c_l_steady(v_cas, altitude, weight, wing_area):
             - ρ is the air density at the given altitude.
             - S is the wing area.
             - V is the true airspeed (TAS), derived from the calibrated airspeed (CAS).
-        - The function internally uses the `Atmosphere` class to determine air density and the `cas2tas` function to convert CAS to TAS.
+        - The function internally uses the tabulated ISA model (`isa_table`) to determine air density and the SI airspeed core to convert CAS to TAS.
     """
 
     # based lift = weight in steady flight condition, calculate lift coeff.
-    rho_at_h = Atmosphere(altitude.magnitude).density[0] * ureg(
-        "kg/m**3"
-    )  # density at altitude h
-    v_tas = cas2tas(v_cas, altitude)  # true airspeed
+    lift_coeff = _c_l_steady_si(
+        v_cas.to("m/s").magnitude,
+        altitude.to("m").magnitude,
+        weight.to("N").magnitude,
+        wing_area.to("m**2").magnitude,
+    )
+
+    # lift coefficient is dimensionless by construction, no unit reduction needed
+    return lift_coeff * _DIMENSIONLESS
+
 
-    lift = weight
+def c_l_steady_array(v_cas_mps, h_m, w_N, s_m2):
+    """
+    Calculate the steady-state lift coefficient (C_L) over arrays of flight conditions.
+
+    Vectorized counterpart of `c_l_steady` for evaluating lift coefficient sweeps
+    (e.g. C_L vs airspeed or C_L vs altitude) in one call, without per-element pint
+    or `Atmosphere` overhead.
+
+    Parameters:
+        v_cas_mps (float or array-like): Calibrated airspeed (CAS) in m/s.
+        h_m (float or array-like): Altitude in meters.
+        w_N (float or array-like): Weight of the aircraft in newtons.
+        s_m2 (float or array-like): Wing area of the aircraft in square meters.
 
-    # from lift equation
-    lift_coeff = (2 * lift) / (rho_at_h * wing_area * v_tas**2)
+    Returns:
+        np.ndarray: The dimensionless steady-state lift coefficients, with the
+        broadcast shape of the inputs.
+    """
 
-    return np.round(lift_coeff.to_reduced_units(), 4)
+    v, h, w, s = np.broadcast_arrays(
+        *(np.asarray(arg, dtype=float) for arg in (v_cas_mps, h_m, w_N, s_m2))
+    )
+    c_l = _c_l_steady_si_array(np.ravel(v), np.ravel(h), np.ravel(w), np.ravel(s))
+    return c_l.reshape(v.shape)
@@ -1,7 +1,33 @@
 import numpy as np
 
 from . import ureg
-from ambiance import Atmosphere
+from ._airspeed_core import (
+    _cas2mach_si,
+    _cas2mach_si_array,
+    _cas2tas_si,
+    _cas2tas_si_array,
+    _tas2cas_si,
+    _tas2cas_si_array,
+    _tas2mach_si,
+    _tas2mach_si_array,
+)
+
+# units attached to the results, resolved once at import
+_MPS = ureg("m/s")
+_DIMENSIONLESS = ureg("dimensionless")
+
+
+def _apply_si(core, core_array, v, h):
+    """
+    Evaluate an SI airspeed core on scalar magnitudes, or elementwise on array
+    magnitudes broadcast against each other.
+    """
+
+    if np.ndim(v) == 0 and np.ndim(h) == 0:
+        return core(v, h)
+
+    v, h = np.broadcast_arrays(np.asarray(v, dtype=float), np.asarray(h, dtype=float))
+    return core_array(np.ravel(v), np.ravel(h)).reshape(v.shape)
 
 
 def cas2tas(v_cas, h):
@@ -22,14 +48,16 @@ def cas2tas(v_cas, h):
     Returns:
     --------
     Quantity
-        True airspeed (TAS) as a quantity with units of speed, rounded to two decimal places.
+        True airspeed (TAS) as a quantity with units of speed.
 
     Notes:
     ------
     - The function assumes dry air with a constant ratio of specific heats (gamma = 1.4).
     - The input quantities must be compatible with the `pint` library for unit handling.
-    - The `Atmosphere` class from the `ambiance` library is used to retrieve atmospheric
-      properties (density, pressure, and speed of sound) at the given altitude.
+    - Atmospheric properties (density and pressure) at the given altitude are taken
+      from the tabulated ISA model in `isa_table`.
+    - `v_cas` and `h` may be scalar or array-valued; arrays are broadcast against each
+      other and converted elementwise in a single call.
     - Compressibility effects are considered in the calculations to ensure accuracy at higher speeds.
 
     Example:
@@ -39,27 +67,16 @@ def cas2tas(v_cas, h):
     >>> v_cas = 100 * ureg('m/s')
     >>> h = 2000 * ureg('m')
     >>> cas2tas(v_cas, h)
-    <Quantity(105.34, 'meter / second')>
+    <Quantity(105.34..., 'meter / second')>
     """
 
-    # compute densities
-    rho_at_h = Atmosphere(h.to("m").m).density[0] * ureg(
-        "kg/m**3"
-    )  # density at altitude h
-    rho_at_sl = Atmosphere(0).density[0] * ureg("kg/m**3")  # densioty at sea level
-    # compute pressures
-    p_at_h = Atmosphere(h.to("m").m).pressure[0] * ureg("Pa")
-    p_at_sl = Atmosphere(0).pressure[0] * ureg("Pa")
-    # ratio of specific heats
-    gamma = 1.4  # for air
-
-    # compute true airspeed
-    g_r = gamma / (gamma - 1)
-    p1 = 1 + (np.power((2 * g_r), -1) * (rho_at_sl / p_at_sl) * v_cas**2)
-    p2 = np.power(p1, g_r)
-    p3 = np.power(1 + ((p_at_sl / p_at_h) * (p2 - 1)), 1 / g_r)
-    v_tas = np.sqrt(2 * g_r * (p_at_h / rho_at_h) * (p3 - 1))
-    return np.round(v_tas.to_base_units(), 2)
+    v_tas = _apply_si(
+        _cas2tas_si,
+        _cas2tas_si_array,
+        v_cas.to("m/s").magnitude,
+        h.to("m").magnitude,
+    )
+    return v_tas * _MPS
 
 
 def cas2mach(v_cas, h):
@@ -75,24 +92,24 @@ def cas2mach(v_cas, h):
 
     Returns:
     --------
-    float
-        Mach number, rounded to three decimal places.
+    Quantity
+        Mach number as a dimensionless quantity, array-valued if `v_cas` or `h` is an array.
 
     Notes:
     ------
     - The function computes the true airspeed (TAS) from the given CAS and altitude.
     - The speed of sound is calculated based on the atmospheric conditions at the given altitude.
     - The Mach number is the ratio of the true airspeed to the speed of sound.
+    - `v_cas` and `h` may be scalar or array-valued; arrays are broadcast against each
+      other and converted elementwise in a single call.
     """
-    # compute true airspeed
-    v_tas = cas2tas(v_cas, h)
-
-    # compute speed of sound at altitude h
-    v_sound = Atmosphere(h.to("m").m).speed_of_sound[0] * ureg("m/s")
-    mach = v_tas / v_sound
-    mach.ito_base_units()
-
-    return np.round(mach, 3)
+    mach = _apply_si(
+        _cas2mach_si,
+        _cas2mach_si_array,
+        v_cas.to("m/s").magnitude,
+        h.to("m").magnitude,
+    )
+    return mach * _DIMENSIONLESS
 
 
 def tas2cas(v_tas, h):
@@ -109,7 +126,7 @@ def tas2cas(v_tas, h):
     Returns:
     --------
     Quantity
-        Calibrated airspeed (CAS) as a quantity with units, rounded to two decimal places.
+        Calibrated airspeed (CAS) as a quantity with units.
 
     Notes:
     ------
@@ -118,27 +135,17 @@ def tas2cas(v_tas, h):
     - Assumes air behaves as an ideal gas with a specific heat ratio (gamma) of 1.4.
     - The calculations involve compressibility effects and are based on the relationship
       between TAS and CAS under varying atmospheric conditions.
+    - `v_tas` and `h` may be scalar or array-valued; arrays are broadcast against each
+      other and converted elementwise in a single call.
     """
 
-    # compute densities
-    rho_at_h = Atmosphere(h.to("m").m).density[0] * ureg(
-        "kg/m**3"
-    )  # density at altitude h
-    rho_at_sl = Atmosphere(0).density[0] * ureg("kg/m**3")  # densioty at sea level
-    # compute pressures
-    p_at_h = Atmosphere(h.to("m").m).pressure[0] * ureg("Pa")
-    p_at_sl = Atmosphere(0).pressure[0] * ureg("Pa")
-    # ratio of specific heats
-    gamma = 1.4  # for air
-
-    # compute true airspeed
-    g_r = gamma / (gamma - 1)
-    p1 = 1 + (np.power((2 * g_r), -1) * (rho_at_h / p_at_h) * v_tas**2)
-    p2 = np.power(p1, g_r) - 1
-    p3 = np.power(((p_at_h / p_at_sl) * p2) + 1, 1 / g_r)
-    p4 = p3 - 1
-    v_cas = np.sqrt(2 * g_r * (p_at_sl / rho_at_sl) * p4)
-    return np.round(v_cas.to_base_units(), 2)
+    v_cas = _apply_si(
+        _tas2cas_si,
+        _tas2cas_si_array,
+        v_tas.to("m/s").magnitude,
+        h.to("m").magnitude,
+    )
+    return v_cas * _MPS
 
 
 def tas2mach(v_tas, h):
@@ -147,29 +154,32 @@ def tas2mach(v_tas, h):
 
     Parameters:
     -----------
-    v_tas : float or Quantity
-        True airspeed in meters per second (m/s). If provided as a Quantity,
-        it should have compatible units of speed.
+    v_tas : Quantity
+        True airspeed as a Quantity with compatible units of speed.
     h : Quantity
         Altitude in meters (m). This should be provided as a Quantity with
         compatible units of length.
 
     Returns:
     --------
-    float
-        The Mach number, calculated as the ratio of true airspeed to the
-        speed of sound at the given altitude. The result is rounded to
-        three decimal places.
+    Quantity
+        The Mach number as a dimensionless quantity, calculated as the ratio of true
+        airspeed to the speed of sound at the given altitude. Array-valued if `v_tas`
+        or `h` is an array.
 
     Notes:
     ------
-    - The speed of sound is determined using the `Atmosphere` class from the
-      `ambiance` library, which calculates it based on the altitude.
+    - The speed of sound is taken from the tabulated ISA model in `isa_table`.
+    - `v_tas` and `h` may be scalar or array-valued; arrays are broadcast against each
+      other and converted elementwise in a single call.
     - Ensure that the altitude (`h`) is provided with proper units to avoid
       calculation errors.
     """
 
-    v_sound = Atmosphere(h.to("m").m).speed_of_sound[0] * ureg("m/s")
-    mach = v_tas / v_sound
-    mach.ito_base_units()
-    return np.round(mach, 3)
+    mach = _apply_si(
+        _tas2mach_si,
+        _tas2mach_si_array,
+        v_tas.to("m/s").magnitude,
+        h.to("m").magnitude,
+    )
+    return mach * _DIMENSIONLESS
@@ -0,0 +1,137 @@
+"""
+Pre-tabulated International Standard Atmosphere (ISA) properties.
+
+`_isa` evaluates the closed-form ISA equations of the troposphere (0 - 11 km) and the
+lower stratosphere (11 - 20 km) directly, with the same constants and geometric to
+geopotential altitude conversion as `ambiance.Atmosphere` but without building an
+object and its arrays. It fills the density, pressure and speed of sound tables once at
+import on a uniform altitude grid covering 0 - 20 km with a 2 m spacing. The lookup
+helpers then interpolate linearly between the two neighbouring grid points.
+
+All helpers take the altitude as a plain float in meters and return plain floats
+in SI units. They are compiled with Numba when available and inlined into the
+compiled airspeed core. `atm_at` returns the density, pressure and speed of sound at
+one altitude together as an `AtmState`, for callers that need several of them.
+"""
+
+import math
+from collections import namedtuple
+
+import numpy as np
+
+from ._jit import njit
+
+# ISA constants, as used by ambiance
+_R = 287.05287  # specific gas constant of air [J/(kg K)]
+_KAPPA = 1.4  # adiabatic index [-]
+_G_0 = 9.80665  # standard gravitational acceleration [m/s**2]
+_R_EARTH = 6356766.0  # earth radius for the geopotential altitude [m]
+_T_0 = 288.15  # sea level temperature [K]
+_P_0 = 101325.0  # sea level pressure [Pa]
+_LAPSE = -0.0065  # troposphere temperature gradient [K/m]
+_H_TROPO = 11000.0  # geopotential altitude of the tropopause [m]
+_T_TROPO = _T_0 + (_LAPSE * _H_TROPO)  # tropopause temperature [K]
+_P_TROPO = 22632.0  # tabulated ICAO tropopause pressure [Pa]
+
+
+@njit(cache=True)
+def _isa(h_m):
+    """
+    ISA temperature [K], pressure [Pa], density [kg/m**3] and speed of sound [m/s]
+    at geometric altitude h_m [m], valid up to 20 km.
+    """
+
+    # geopotential altitude
+    h_geop = _R_EARTH * h_m / (_R_EARTH + h_m)
+
+    if h_geop < _H_TROPO:
+        temp = _T_0 + (_LAPSE * h_geop)
+        p = _P_0 * math.pow(temp / _T_0, -_G_0 / (_LAPSE * _R))
+    else:
+        temp = _T_TROPO
+        p = _P_TROPO * math.exp(-_G_0 / (_R * temp) * (h_geop - _H_TROPO))
+
+    return temp, p, p / (_R * temp), math.sqrt(_KAPPA * _R * temp)
+
+
+@njit(cache=True)
+def _isa_tables(h):
+    """
+    Density, pressure and speed of sound tables for the altitudes h [m].
+    """
+
+    rho = np.empty(h.size)
+    p = np.empty(h.size)
+    a = np.empty(h.size)
+    for i in range(h.size):
+        _, p[i], rho[i], a[i] = _isa(h[i])
+    return rho, p, a
+
+
+_H_MAX = 20000.0  # upper altitude bound of the table [m]
+_N = 10001  # number of grid points
+_DH = _H_MAX / (_N - 1)  # grid spacing [m]
+_INV_DH = 1 / _DH
+
+_H = np.linspace(0, _H_MAX, _N)
+_RHO, _P, _A = _isa_tables(_H)
+
+# density [kg/m**3], pressure [Pa] and speed of sound [m/s] at one altitude
+AtmState = namedtuple("AtmState", ["rho", "p", "a"])
+
+
+@njit(cache=True, inline="always")
+def _interp(table, h_m):
+    """
+    Linearly interpolate a uniformly spaced ISA table at altitude h_m [m].
+    Altitudes outside the table are linearly extrapolated from the nearest interval.
+    """
+
+    i = h_m * _INV_DH
+    i0 = min(max(int(i), 0), _N - 2)
+    frac = i - i0
+    return table[i0] + frac * (table[i0 + 1] - table[i0])
+
+
+@njit(cache=True, inline="always")
+def rho_at(h_m):
+    """
+    Air density [kg/m**3] at altitude h_m [m].
+    """
+
+    return _interp(_RHO, h_m)
+
+
+@njit(cache=True, inline="always")
+def p_at(h_m):
+    """
+    Air pressure [Pa] at altitude h_m [m].
+    """
+
+    return _interp(_P, h_m)
+
+
+@njit(cache=True, inline="always")
+def a_at(h_m):
+    """
+    Speed of sound [m/s] at altitude h_m [m].
+    """
+
+    return _interp(_A, h_m)
+
+
+@njit(cache=True, inline="always")
+def atm_at(h_m):
+    """
+    Air density [kg/m**3], pressure [Pa] and speed of sound [m/s] at altitude h_m [m]
+    as an `AtmState`, locating the table interval once for all three.
+    """
+
+    i = h_m * _INV_DH
+    i0 = min(max(int(i), 0), _N - 2)
+    frac = i - i0
+    return AtmState(
+        _RHO[i0] + frac * (_RHO[i0 + 1] - _RHO[i0]),
+        _P[i0] + frac * (_P[i0 + 1] - _P[i0]),
+        _A[i0] + frac * (_A[i0 + 1] - _A[i0]),
+    )
@@ -1,9 +1,103 @@
+import math
+
 import numpy as np
 
 from . import ureg
-from ..helpers.aerodynamics import c_l_steady
-from ..helpers.airspeed import cas2tas, cas2mach
-from ambiance import Atmosphere
+from ..helpers._airspeed_core import _cas2tas_mach_isa
+from ..helpers._jit import njit
+from ..helpers.aerodynamics import _c_l_steady_si
+from ..helpers.isa_table import atm_at
+
+# drag polar breakpoints, refer to the simulation PDF document
+_POLAR_MACH = np.array([0.3, 0.5, 0.6, 0.7, 0.8, 0.85])
+_POLAR_C_D0 = np.array([0.0132, 0.0131, 0.0131, 0.0130, 0.0130, 0.0128])
+_POLAR_K = np.array([0.056, 0.057, 0.058, 0.061, 0.067, 0.074])
+
+# tolerance on the highest breakpoint, Mach numbers are reported with three decimal
+# places and the Mach hold settles within half a unit of the last one above 0.85
+_POLAR_MACH_TOL = 0.0005
+
+# units attached to the results, resolved once at import
+_RAD = ureg("rad")
+_NEWTON = ureg("N")
+
+
+@njit(cache=True)
+def _aoa_steady_straight_si(c_l):
+    """
+    SI-float core of `aoa_steady_staight`: angle of attack [rad] for lift coefficient c_l.
+    """
+
+    return (c_l - 0.03) / 4.4
+
+
+@njit(cache=True)
+def _lift_drag_polars_si(mach):
+    """
+    SI-float core of `lift_drag_polars`: (c_d0, k) for a plain float Mach number.
+    """
+
+    # check, Mach numbers within the tolerance above 0.85 take the polar of 0.85 below
+    if mach > _POLAR_MACH[-1] + _POLAR_MACH_TOL:
+        raise ValueError(
+            "Mach number should be lower than constant cruise mach of 0.85"
+        )
+
+    # highest breakpoint not above the Mach number, the lowest one below 0.3
+    i = _POLAR_MACH.size - 1
+    while i > 0 and mach < _POLAR_MACH[i]:
+        i -= 1
+    return _POLAR_C_D0[i], _POLAR_K[i]
+
+
+@njit(cache=True)
+def _drag_coeff_si(mach, c_l):
+    """
+    SI-float core of `drag_coeff`.
+    """
+
+    c_d0, k = _lift_drag_polars_si(mach)
+    return c_d0 + (k * c_l**2)
+
+
+@njit(cache=True)
+def _drag_isa(v_cas, atm, c_l, s):
+    """
+    `_drag_si` given the atmospheric state `atm` (an `isa_table.AtmState`) at the
+    current altitude instead of the altitude.
+    """
+
+    v_tas, mach = _cas2tas_mach_isa(v_cas, atm)
+    c_d = _drag_coeff_si(mach, c_l)
+    return c_d * (1 / 2) * atm.rho * s * v_tas**2
+
+
+@njit(cache=True)
+def _drag_si(v_cas, h, c_l, s):
+    """
+    SI-float core of `drag`: CAS in [m/s], altitude in [m], wing area in [m**2].
+    Returns the drag force in [N].
+    """
+
+    return _drag_isa(v_cas, atm_at(h), c_l, s)
+
+
+@njit(cache=True)
+def _gamma_steady_straight_si(thrust, drag, w):
+    """
+    SI-float core of `gamma_steady_straight`: forces in [N], returns gamma in [rad].
+    """
+
+    return math.asin((thrust - drag) / w)
+
+
+def _magnitude(value):
+    """
+    Plain float value of a dimensionless quantity (e.g. a Mach number or lift
+    coefficient), which may be passed either as a float or a pint Quantity.
+    """
+
+    return ureg.Quantity(value).to("dimensionless").magnitude
 
 
 def aoa_steady_staight(v_cas, h, w, s):
@@ -22,13 +116,19 @@ def aoa_steady_staight(v_cas, h, w, s):
         s (float): Wing surface area in square meters.
 
     Returns:
-        float: Angle of attack (AoA) in radians, rounded to 4 decimal places.
+        Quantity: Angle of attack (AoA) in radians.
     """
 
-    lift_coeff = c_l_steady(v_cas, h, w, s)
+    # convert once at the boundary and stay in SI floats for the lift coefficient
+    lift_coeff = _c_l_steady_si(
+        v_cas.to("m/s").magnitude,
+        h.to("m").magnitude,
+        w.to("N").magnitude,
+        s.to("m**2").magnitude,
+    )
 
     # return angle of attack in rad
-    return np.round((lift_coeff - 0.03) / 4.4 * ureg("1 rad"), 4)
+    return _aoa_steady_straight_si(lift_coeff) * _RAD
 
 
 def lift_drag_polars(mach):
@@ -62,26 +162,7 @@ def lift_drag_polars(mach):
         0.0131 0.057
     """
 
-    mach = mach.magnitude
-    # initialize values
-    mach_numbers = [0.3, 0.5, 0.6, 0.7, 0.8, 0.85]
-    c_d0 = [0.0132, 0.0131, 0.0131, 0.0130, 0.0130, 0.0128]
-    k = [0.056, 0.057, 0.058, 0.061, 0.067, 0.074]
-    # check
-    if mach > mach_numbers[-1]:
-        raise ValueError(
-            f"Mach number should be lower than constant cruise mach of 0.85"
-        )
-
-    if mach <= 0.3:
-        return c_d0[0], k[0]
-    else:
-        mach_numbers.reverse()
-        c_d0.reverse()
-        k.reverse()
-        for i in range(len(mach_numbers)):
-            if mach >= mach_numbers[i]:
-                return c_d0[i], k[i]
+    return _lift_drag_polars_si(_magnitude(mach))
 
 
 # compute drag coeff
@@ -104,8 +185,7 @@ def drag_coeff(mach, c_l):
         float: The drag coefficient (C_d) for the given Mach number and lift coefficient.
     """
 
-    c_d0, k = lift_drag_polars(mach)
-    return c_d0 + (k * c_l**2)
+    return _drag_coeff_si(_magnitude(mach), _magnitude(c_l))
 
 
 # compute drag based on drag equation
@@ -127,7 +207,7 @@ def drag(v_cas, h, c_l, s):
     Returns:
     --------
     Quantity
-        The aerodynamic drag force, rounded to 4 decimal places, in the preferred unit of force (newtons).
+        The aerodynamic drag force in newtons.
 
     Notes:
     ------
@@ -136,11 +216,13 @@ def drag(v_cas, h, c_l, s):
     - True airspeed (TAS) is derived from the calibrated airspeed (CAS) and altitude.
     """
 
-    rho = Atmosphere(h.to("m").m).density[0] * ureg("kg/m**3")
-    v_tas = cas2tas(v_cas, h)
-    c_d = drag_coeff(cas2mach(v_cas, h), c_l)
-    drag = c_d * (1 / 2) * rho * s * v_tas**2
-    return np.round(drag, 4).to_preferred()
+    drag = _drag_si(
+        v_cas.to("m/s").magnitude,
+        h.to("m").magnitude,
+        _magnitude(c_l),
+        s.to("m**2").magnitude,
+    )
+    return drag * _NEWTON
 
 
 def gamma_steady_straight(thrust, drag, w):
@@ -161,4 +243,7 @@ def gamma_steady_straight(thrust, drag, w):
     """
 
     # return gamma in radians
-    return np.arcsin((thrust - drag) / w)
+    gamma = _gamma_steady_straight_si(
+        thrust.to("N").magnitude, drag.to("N").magnitude, w.to("N").magnitude
+    )
+    return gamma * _RAD
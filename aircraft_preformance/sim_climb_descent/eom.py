@@ -1,7 +1,38 @@
-import numpy as np
+import math
 
+from . import ureg
+from ..helpers._jit import njit
 from .const import Grav_const
 
+_G = Grav_const.to("m/s**2").magnitude  # gravitational acceleration [m/s**2]
+
+# units attached to the results, resolved once at import
+_MPS2 = ureg("m/s**2")
+_RAD_PER_S = ureg("rad/s")
+
+
+@njit(cache=True)
+def _inst_dv_dt_si(thrust, drag, g_over_w, gamma):
+    """
+    SI-float core of `inst_dv_dt`: forces in [N], `g_over_w` = g / W in [1/kg],
+    flight path angle in [rad]. Returns the acceleration along the flight path in [m/s**2].
+
+    The weight only changes with fuel burn, so callers evaluate `g_over_w` once per
+    time step and share it with `_inst_dgamma_dt_si`.
+    """
+
+    return (g_over_w * (thrust - drag)) - (_G * math.sin(gamma))
+
+
+@njit(cache=True)
+def _inst_dgamma_dt_si(lift, g_over_w, v_tas):
+    """
+    SI-float core of `inst_dgamma_dt`: lift in [N], `g_over_w` = g / W in [1/kg],
+    true airspeed in [m/s]. Returns the flight path angle rate in [rad/s].
+    """
+
+    return ((g_over_w * lift) - _G) / v_tas
+
 
 def inst_dv_dt(thrust, drag, w, gamma):
     """
@@ -14,16 +45,20 @@ def inst_dv_dt(thrust, drag, w, gamma):
         gamma (Quantity): The flight path angle (e.g., in radians).
 
     Returns:
-        Quantity: The instantaneous rate of change of velocity (dv/dt), rounded to 4 decimal places.
+        Quantity: The instantaneous rate of change of velocity (dv/dt).
 
     Notes:
     - Grav_const is assumed to be a predefined constant representing the gravitational acceleration (in meters per second squared).
     - The formula is derived from the equations of motion for an aircraft in a climb or descent.
     """
 
-    return np.round(
-        ((Grav_const / w) * (thrust - drag - (w * np.sin(gamma)))).to_reduced_units(), 4
+    dv_dt = _inst_dv_dt_si(
+        thrust.to("N").magnitude,
+        drag.to("N").magnitude,
+        _G / w.to("N").magnitude,
+        gamma.to("rad").magnitude,
     )
+    return dv_dt * _MPS2
 
 
 def inst_dgamma_dt(lift, w, v_tas):
@@ -31,15 +66,20 @@ def inst_dgamma_dt(lift, w, v_tas):
     Calculate the instantaneous rate of change of the flight path angle (gamma) with respect to time.
 
     Parameters:
-    lift (float): The lift force acting on the aircraft (in Newtons).
-    w (float): The weight of the aircraft (in Newtons).
-    v_tas (float): The true airspeed of the aircraft (in meters per second).
+    lift (Quantity): The lift force acting on the aircraft (in Newtons).
+    w (Quantity): The weight of the aircraft (in Newtons).
+    v_tas (Quantity): The true airspeed of the aircraft (in meters per second).
 
     Returns:
-    float: The rate of change of the flight path angle (gamma) with respect to time (in radians per second).
+    Quantity: The rate of change of the flight path angle (gamma) with respect to time (in radians per second).
 
     Notes:
     - Grav_const is assumed to be a predefined constant representing the gravitational acceleration (in meters per second squared).
     - The formula is derived from the equations of motion for an aircraft in a climb or descent.
     """
-    return (Grav_const / w) * (1 / v_tas) * (lift - w)
+    dgamma_dt = _inst_dgamma_dt_si(
+        lift.to("N").magnitude,
+        _G / w.to("N").magnitude,
+        v_tas.to("m/s").magnitude,
+    )
+    return dgamma_dt * _RAD_PER_S
@@ -0,0 +1,297 @@
+"""
+Compiled batch integrators for the climb, descent and descent approach simulations.
+
+`integrate_climb_si` runs the explicit Euler scheme, pilot control law and stop
+conditions of `simulation.simulation_euler`, and `integrate_approach_si` the steady
+glide of `simulation.simulation_descent_approach_euler`. Each keeps the whole step
+loop in a single function built from the SI-float cores. With Numba installed the
+complete trajectory integrates in machine code, with no Python or pint round-trip
+between time steps. The ISA table is probed once per step, for the `_isa` variants of
+the cores. All inputs and outputs are plain floats and arrays in SI units.
+"""
+
+import math
+
+import numpy as np
+
+from ..helpers._airspeed_core import _cas2tas_mach_isa, _tas2cas_isa
+from ..helpers._jit import njit
+from ..helpers.aerodynamics import _c_l_steady_isa
+from ..helpers.isa_table import atm_at
+from .aerodynamic_char import (
+    _aoa_steady_straight_si,
+    _drag_coeff_si,
+    _drag_isa,
+    _gamma_steady_straight_si,
+)
+from .const import S
+from .eom import _G, _inst_dgamma_dt_si, _inst_dv_dt_si
+from .pilot_control import _mach_hold_cas_table_si, _pilot_pitch_control_si
+from .thrust_model import _MAX_THRUST_CONSTS, _fuel_flow_isa, _max_thrust_fixed_isa
+
+# aircraft constants in SI units
+_S = S.to("m**2").magnitude  # wing area [m**2]
+_N_ENGINES = 4
+
+# stop altitudes, aircraft reaches a cruise altitude of 10,000 m or descends to 1000 m
+_H_CLIMB_END = 10000.0
+_H_DESCENT_END = 1000.0
+
+
+@njit(cache=True)
+def _thrust_scale_si(phase_is_climb):
+    """
+    Total applied thrust of the engines as a multiple of the single engine max thrust.
+    """
+
+    # 95% of max thrust is applied for climb phase and 5% of max thrust is applied for descent phase
+    thrust_app_perc = 0.95 if phase_is_climb else 0.05
+    return _N_ENGINES * thrust_app_perc
+
+
+@njit(cache=True)
+def _reached_end_si(h, phase_is_climb):
+    """
+    Stop condition of the climb or descent: True once the altitude `h` [m] reaches the
+    cruise altitude, respectively descends to the descent end altitude.
+    """
+
+    return h >= _H_CLIMB_END if phase_is_climb else h <= _H_DESCENT_END
+
+
+@njit(cache=True)
+def _euler_trim_si(h, w, v_ias, thrust_scale):
+    """
+    Trimmed initial condition of the climb or descent at altitude `h` [m], weight `w`
+    [N] and IAS `v_ias` [m/s], with the max thrust scaled by `thrust_scale`.
+
+    Returns:
+        tuple: `(atm, v_tas, mach, aoa, gamma)`, the atmosphere at `h`, the TAS [m/s],
+        Mach number, angle of attack [rad] and flight path angle [rad].
+    """
+
+    atm = atm_at(h)
+    v_tas, mach = _cas2tas_mach_isa(v_ias, atm)
+    c_l = _c_l_steady_isa(v_ias, atm, w, _S)
+    aoa = _aoa_steady_straight_si(c_l)
+    gamma = _gamma_steady_straight_si(
+        thrust_scale * _max_thrust_fixed_isa(_MAX_THRUST_CONSTS, atm, mach),
+        _drag_isa(v_ias, atm, c_l, _S),
+        w,
+    )
+    return atm, v_tas, mach, aoa, gamma
+
+
+@njit(cache=True)
+def _euler_step_si(
+    dt, thrust_scale, theta, x, h, w, v_tas, mach, gamma, m_f_burnt, atm
+):
+    """
+    One explicit Euler step of the climb or descent for the pitch attitude `theta`
+    [rad] commanded at the start of dt, from the state `(x, h, w, v_tas, mach, gamma,
+    m_f_burnt)` and the atmosphere `atm` at `h`.
+
+    Returns:
+        tuple: `(x, h, w, v_tas, v_ias, mach, gamma, m_f_burnt, aoa, atm)`, the state,
+        IAS and atmosphere after dt and the angle of attack [rad] flown during dt.
+    """
+
+    aoa = theta - gamma
+    c_l = 0.03 + (4.4 * aoa)
+
+    # compute forces at start of dt, lift and drag from the same dynamic pressure
+    q_s = 0.5 * atm.rho * v_tas * v_tas * _S
+    inst_lift = c_l * q_s
+    inst_thrust = thrust_scale * _max_thrust_fixed_isa(_MAX_THRUST_CONSTS, atm, mach)
+    inst_drag = _drag_coeff_si(mach, c_l) * q_s
+    g_over_w = _G / w
+
+    # simulate changes during dt
+    dh = v_tas * math.sin(gamma) * dt
+    dx = v_tas * math.cos(gamma) * dt
+    dv_tas = _inst_dv_dt_si(inst_thrust, inst_drag, g_over_w, gamma) * dt
+    dgamma = _inst_dgamma_dt_si(inst_lift, g_over_w, v_tas) * dt
+    dm = -_fuel_flow_isa(inst_thrust, mach, atm) * dt
+
+    # reflect changes after dt, the atmosphere at the new altitude serves the next step
+    x += dx
+    h += dh
+    atm = atm_at(h)
+    v_tas += dv_tas
+    v_ias = _tas2cas_isa(v_tas, atm.rho, atm.p)
+    mach = v_tas / atm.a
+    gamma += dgamma
+    m_f_burnt -= dm
+    w += dm * _G
+
+    return x, h, w, v_tas, v_ias, mach, gamma, m_f_burnt, aoa, atm
+
+
+@njit(cache=True)
+def integrate_climb_si(t_end, dt, state0, params):
+    """
+    Integrate a climb or descent trajectory with the explicit Euler method.
+
+    Parameters:
+        t_end (float): Upper bound of the simulated time in [s]. The integration stops
+            earlier once the climb or descent end altitude is reached.
+        dt (float): Time step in [s].
+        state0 (tuple): Initial state `(x, h, w, v_ias)` in [m], [m], [N] and [m/s].
+        params (tuple): Pilot control parameters `(k_p, v_ref, cruise_mach, phase_is_climb)`
+            with the gain in [rad s/m], the reference IAS in [m/s], the cruise Mach number and
+            True for the climb phase, False for the descent phase.
+
+    Returns:
+        numpy.ndarray: One row per time step with the columns
+        `(t, x, h, v_tas, v_ias, mach, gamma, fuel_burn, aoa, theta)` in [s], [m], [m],
+        [m/s], [m/s], [-], [rad], [kg], [rad] and [rad].
+    """
+
+    # float inputs, every row of the result buffer is written as one tuple of floats
+    dt = float(dt)
+    x, h, w, v_ias = (
+        float(state0[0]),
+        float(state0[1]),
+        float(state0[2]),
+        float(state0[3]),
+    )
+    k_p, v_ref, cruise_mach, phase_is_climb = params
+
+    thrust_scale = _thrust_scale_si(phase_is_climb)
+
+    # Mach-hold target IAS over altitude, tabulated once per trajectory
+    mach_hold_cas = _mach_hold_cas_table_si(cruise_mach)
+
+    # one row per time step, the columns in the order of `simulation._EULER_KEYS`
+    n_max = int(math.ceil(t_end / dt))
+    res = np.empty((n_max + 1, 10))
+
+    # trimmed initial condition
+    atm, v_tas, mach, aoa, gamma = _euler_trim_si(h, w, v_ias, thrust_scale)
+    theta_trim = aoa + gamma
+    m_f_burnt = 0.0
+    res[0] = (0.0, x, h, v_tas, v_ias, mach, gamma, m_f_burnt, aoa, theta_trim)
+
+    n = 0
+    while n < n_max:
+        # re-evaluate control model at start of dt
+        theta = _pilot_pitch_control_si(
+            k_p, theta_trim, v_ref, v_ias, h, cruise_mach, phase_is_climb, mach_hold_cas
+        )
+        x, h, w, v_tas, v_ias, mach, gamma, m_f_burnt, aoa, atm = _euler_step_si(
+            dt, thrust_scale, theta, x, h, w, v_tas, mach, gamma, m_f_burnt, atm
+        )
+
+        n += 1
+        res[n] = (n * dt, x, h, v_tas, v_ias, mach, gamma, m_f_burnt, aoa, theta)
+
+        if _reached_end_si(h, phase_is_climb):
+            break
+
+    return res[: n + 1]
+
+
+@njit(cache=True)
+def integrate_approach_si(dt, state0, params):
+    """
+    Integrate a descent approach along the glideslope with the explicit Euler method.
+
+    Parameters:
+        dt (float): Time step in [s].
+        state0 (tuple): Initial state `(x, h, w)` in [m], [m] and [N].
+        params (tuple): Approach parameters `(v_tas, glideslope_angle, screen_h)`: the
+            constant TAS in [m/s], the glideslope angle in [rad] and the screen height
+            in [m] at which the approach ends.
+
+    Returns:
+        tuple: NumPy arrays `(t, x, h, v_ias, mach, fuel_burn, aoa, theta, thrust)`
+        sampled at every time step down to the screen height, in [s], [m], [m], [m/s],
+        [-], [kg], [rad], [rad] and [N].
+    """
+
+    x, h, w = state0
+    v_tas, glideslope_angle, screen_h = params
+    gamma = -glideslope_angle
+    sin_gamma = math.sin(gamma)
+    cos_gamma = math.cos(gamma)
+
+    # the sink rate is constant, which bounds the number of steps to the screen height
+    n_max = int(math.ceil((h - screen_h) / (v_tas * -sin_gamma * dt))) + 2
+    t_out = np.empty(n_max)
+    x_out = np.empty(n_max)
+    h_out = np.empty(n_max)
+    v_ias_out = np.empty(n_max)
+    mach_out = np.empty(n_max)
+    fuel_out = np.empty(n_max)
+    aoa_out = np.empty(n_max)
+    theta_out = np.empty(n_max)
+    thrust_out = np.empty(n_max)
+
+    m_f_burnt = 0.0
+    atm = atm_at(h)
+    mach = v_tas / atm.a
+    t_out[0] = 0.0
+    x_out[0] = x
+    h_out[0] = h
+    mach_out[0] = mach
+    fuel_out[0] = m_f_burnt
+
+    n = 0
+    while n < n_max - 1:
+        v_ias_out[n] = _tas2cas_isa(v_tas, atm.rho, atm.p)
+
+        # dynamic pressure times wing area [N] at the start of dt, the steady lift
+        # coefficient and the drag follow from it directly
+        q_s = 0.5 * atm.rho * v_tas * v_tas * _S
+
+        # based on simplified EOM for steady straight powered glide flight compute pitch and thrust setting
+        c_l = w / q_s
+        aoa = _aoa_steady_straight_si(c_l)
+        aoa_out[n] = aoa
+        theta_out[n] = aoa + gamma
+
+        inst_drag = _drag_coeff_si(mach, c_l) * q_s
+        inst_thrust = inst_drag + (w * sin_gamma)
+        thrust_out[n] = inst_thrust
+
+        # compute changes during time_step dt
+        dh = v_tas * sin_gamma * dt
+        dx = v_tas * cos_gamma * dt
+        dm = -_fuel_flow_isa(inst_thrust, mach, atm) * dt
+
+        # reflect changes
+        h += dh
+        x += dx
+        m_f_burnt -= dm
+        w += dm * _G
+        atm = atm_at(h)
+        mach = v_tas / atm.a
+
+        if h <= screen_h:
+            break
+        n += 1
+        t_out[n] = n * dt
+        x_out[n] = x
+        h_out[n] = h
+        mach_out[n] = mach
+        fuel_out[n] = m_f_burnt
+
+    # the arrays are sized with a margin over the estimated number of steps, running out
+    # of them means the estimate no longer matches the step loop
+    if h > screen_h:
+        raise RuntimeError(
+            "Approach did not reach the screen height within n_max steps"
+        )
+
+    n += 1
+    return (
+        t_out[:n],
+        x_out[:n],
+        h_out[:n],
+        v_ias_out[:n],
+        mach_out[:n],
+        fuel_out[:n],
+        aoa_out[:n],
+        theta_out[:n],
+        thrust_out[:n],
+    )
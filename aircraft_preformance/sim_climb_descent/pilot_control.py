@@ -1,11 +1,108 @@
+from functools import lru_cache
+
 import numpy as np
+from pint import DimensionalityError
 
 from . import ureg
-from ..helpers.airspeed import cas2mach, tas2cas
-from ambiance import Atmosphere
+from ..helpers._airspeed_core import _cas2tas_isa, _tas2cas_isa
+from ..helpers._jit import njit
+from ..helpers.isa_table import _A, _H, _P, _RHO, _interp, a_at, p_at, rho_at
+
+# units of the gain and the result, resolved once at import
+_GAIN = ureg.Unit("rad*s/m")
+_RAD = ureg.Unit("rad")
+
+
+def _gain_si(k_p):
+    """
+    Pilot gain `k_p` in [rad s/m]. A gain in s/m, as the control law took it before,
+    converts unchanged since radians are dimensionless. A plain number or a gain of
+    another dimension raises a `DimensionalityError`.
+    """
+
+    k_p = ureg.Quantity(k_p)
+    if not k_p.check("[time] / [length]"):
+        raise DimensionalityError(
+            k_p.units,
+            _GAIN,
+            extra_msg=": the pilot gain k_p is given in rad*s/m, "
+            "radians of pitch per m/s of IAS error",
+        )
+    return k_p.to(_GAIN).magnitude
+
+
+@njit(cache=True)
+def _mach_hold_cas_table_si(cruise_mach):
+    """
+    Target IAS [m/s] that holds `cruise_mach` at every altitude of the ISA table grid.
+    """
+
+    out = np.empty(_H.size)
+    for i in range(_H.size):
+        out[i] = _tas2cas_isa(cruise_mach * _A[i], _RHO[i], _P[i])
+    return out
+
+
+@lru_cache(maxsize=8)
+def _mach_hold_cas_table(cruise_mach):
+    """
+    `_mach_hold_cas_table_si`, tabulated once per cruise Mach number.
+    """
 
+    return _mach_hold_cas_table_si(cruise_mach)
 
-def pilot_pitch_control(k_p, theta_trim, v_ref, v_ias, h, cruise_mach, phase):
+
+@njit(cache=True)
+def _pilot_pitch_control_si(
+    k_p, theta_trim, v_ref, v_ias, h, cruise_mach, phase_is_climb, mach_hold_cas
+):
+    """
+    SI-float core of `pilot_pitch_control`.
+
+    Gain in [rad s/m], angles in [rad], airspeeds in [m/s] and altitude in [m].
+    `mach_hold_cas` is the Mach-hold target IAS table from `_mach_hold_cas_table`.
+    Returns the pitch attitude in [rad].
+    """
+
+    # climb: hold IAS until the Mach number reaches the cruise Mach to two decimal places
+    # descent: hold the cruise Mach until the IAS reaches the reference IAS to the nearest m/s
+    if phase_is_climb:
+        hold_v_ref = (
+            _cas2tas_isa(v_ias, rho_at(h), p_at(h)) / a_at(h) < cruise_mach - 0.005
+        )
+    else:
+        hold_v_ref = v_ias >= v_ref - 0.5
+    v_target = v_ref if hold_v_ref else _interp(mach_hold_cas, h)
+
+    # Calculate the pitch response based on the error and trim value
+    return ((v_ias - v_target) * k_p) + theta_trim
+
+
+@njit(cache=True)
+def _pilot_pitch_control_si_array(
+    k_p, theta_trim, v_ref, v_ias, h, cruise_mach, phase_is_climb, mach_hold_cas
+):
+    """
+    Elementwise `_pilot_pitch_control_si` over 1-D float64 arrays of IAS [m/s] and
+    altitude [m].
+    """
+
+    out = np.empty(v_ias.size)
+    for i in range(v_ias.size):
+        out[i] = _pilot_pitch_control_si(
+            k_p,
+            theta_trim,
+            v_ref,
+            v_ias[i],
+            h[i],
+            cruise_mach,
+            phase_is_climb,
+            mach_hold_cas,
+        )
+    return out
+
+
+def pilot_pitch_control(k_p, theta_trim, v_ref, v_ias, h, cruise_mach, phase_is_climb):
     """Represents pilot pitch control to maintain a specific desired IAS (Indicated Airspeed) or Mach Number.
 
     This function models the pilot's pitch control response based on the current
@@ -14,35 +111,64 @@ def pilot_pitch_control(k_p, theta_trim, v_ref, v_ias, h, cruise_mach, phase):
 
     Parameters:
         k_p (pint.Quantity): Proportional gain determined through trial and error
-            using the simulation model.
+            using the simulation model, in radians of pitch per m/s of IAS error,
+            e.g. `ureg('0.18 rad*s/m')`. As radians are dimensionless, a gain given
+            in s/m is read as rad*s/m.
         theta_trim (pint.Quantity): Trimmed pitch attitude at the start of the
             simulation phase.
         v_ref_ias (pint.Quantity): Reference constant IAS (Indicated Airspeed)
             to be maintained.
         v_ias (pint.Quantity): Instantaneous IAS of the aircraft.
-        h (pint.Quantity): Instantaneous altitude of the aircraft.
+        h (pint.Quantity): Instantaneous altitude of the aircraft. `v_ias` and `h`
+            may be scalar or array-valued, e.g. the histories of a simulation result.
+            Arrays are broadcast against each other and evaluated in a single call.
         cruise_mach (float): Cruise Mach number, used as a reference for speed
             during climb or descent.
-        phase (str): Simulation phase, either 'climb' or 'descent'.
+        phase_is_climb (bool): True for the climb phase, False for the descent phase.
+            Evaluate it once per simulation rather than comparing phase strings per tick.
+            The phase names 'climb' and 'descent' are still accepted.
 
     Returns:
-        pint.Quantity: The pilot's instantaneous pitch response in radians.
+        pint.Quantity: The pilot's instantaneous pitch response in radians, with the
+            broadcast shape of `v_ias` and `h`.
+
+    Raises:
+        DimensionalityError: If `k_p` is not a gain in rad*s/m or s/m.
+        ValueError: If `phase_is_climb` is a string other than 'climb' or 'descent'.
     """
 
-    # Calculate the speed of sound at the current altitude
-    v_sound = Atmosphere(h.to("m").m).speed_of_sound[0] * ureg("m/s")
+    # the phase was passed by name before, a non-empty string would read as a climb
+    if isinstance(phase_is_climb, str):
+        if phase_is_climb not in ("climb", "descent"):
+            raise ValueError("Phase must be either 'climb' or 'descent'.")
+        phase_is_climb = phase_is_climb == "climb"
 
-    # Determine the error in airspeed based on the phase of flight
-    if phase == "climb":
-        if np.round(cas2mach(v_ias, h), 2) < cruise_mach:
-            v_error = v_ias - v_ref
-        else:
-            v_error = v_ias - tas2cas(cruise_mach * v_sound, h)
-    else:  # Descent phase
-        if np.round(v_ias) < v_ref:
-            v_error = v_ias - tas2cas(cruise_mach * v_sound, h)
-        else:
-            v_error = v_ias - v_ref
+    gains = (
+        _gain_si(k_p),
+        theta_trim.to("rad").magnitude,
+        v_ref.to("m/s").magnitude,
+    )
+    v_ias = v_ias.to("m/s").magnitude
+    h = h.to("m").magnitude
+    mach_hold_cas = _mach_hold_cas_table(cruise_mach)
 
-    # Calculate the pitch response based on the error and trim value
-    return ((v_error * k_p) * ureg("1 rad")) + theta_trim
+    if np.ndim(v_ias) == 0 and np.ndim(h) == 0:
+        theta = _pilot_pitch_control_si(
+            *gains, v_ias, h, cruise_mach, phase_is_climb, mach_hold_cas
+        )
+    else:
+        # the control law switches between IAS and Mach hold, so it is evaluated
+        # pointwise in the compiled loop rather than as a closed-form array expression
+        v_ias, h = np.broadcast_arrays(
+            np.asarray(v_ias, dtype=float), np.asarray(h, dtype=float)
+        )
+        theta = _pilot_pitch_control_si_array(
+            *gains,
+            np.ravel(v_ias),
+            np.ravel(h),
+            cruise_mach,
+            phase_is_climb,
+            mach_hold_cas,
+        ).reshape(v_ias.shape)
+    # the gain already carries the radians, so wrap the float without a pint multiply
+    return ureg.Quantity(theta, _RAD)
@@ -1,15 +1,492 @@
-import matplotlib.pyplot as plt
+from dataclasses import dataclass
+from functools import lru_cache, partial
+
 import numpy as np
 
 from . import ureg
-from ..helpers.airspeed import cas2tas
+from ..helpers._airspeed_core import _cas2tas_si_array
+
+# matplotlib is imported on the first plot call, see `_ensure_mpl`. The plots are
+# drawn from plain magnitudes in the units below, with explicit axis labels.
+plt = None
+_MPL_READY = False
+
+# units used by the plots, resolved once at import
+_M = ureg.m
+_KM = ureg.km
+_FT = ureg.ft
+_MIN = ureg.min
+_KG = ureg.kg
+_DEG = ureg.deg
+_RAD = ureg.rad
+_MPS = ureg.m / ureg.s
+_NEWTON = ureg.N
+_KN = ureg.kN
+
+# factors of the annotation units, so single values are converted without pint
+_FT_PER_KM = (1 * _KM).to(_FT).magnitude
+_KN_PER_N = (1 * _NEWTON).to(_KN).magnitude
+
+# annotation offsets in the plotted units [km], [m/s], [min] and [deg]
+_VY_OFFSET = 0.5
+_MS_OFFSET = 10.0
+_MS_OFFSET_CROSSOVER = 15.0
+_MIN_OFFSET = 2.0
+_MIN_OFFSET_DESCENT = 5.0
+_MIN_ONE = 1.0
+_MIN_HALF = 0.5
+_DEG_ONE = 1.0
+_DEG_HALF = 0.5
+
+# lowest Mach number rounding to the cruise Mach of 0.85 at 2 decimal places
+_MACH_CROSSOVER = 0.845
+
+# arrow and box styles of the single-arrow annotations, keyed by their color.
+# matplotlib copies them into each annotation, so they are shared between plots.
+_ANNOTATION_STYLES = {
+    color: (
+        dict(facecolor=color, arrowstyle="->"),
+        dict(facecolor=face, alpha=0.5, edgecolor=color),
+    )
+    for color, face in (
+        ("green", "lightgreen"),
+        ("blue", "lightblue"),
+        ("red", "lightcoral"),
+    )
+}
+
+
+def _ensure_mpl():
+    """
+    Import matplotlib.pyplot on first use, so that importing this module does not
+    load matplotlib.
+    """
+
+    global plt, _MPL_READY
+    if _MPL_READY:
+        return
+    import matplotlib.pyplot as pyplot
+
+    plt = pyplot
+    _MPL_READY = True
+
+
+@lru_cache(maxsize=4096)
+def _fmt(mag_rounded, unit_suffix):
+    """
+    Annotation text for an already rounded magnitude followed by its unit suffix.
+    """
+
+    return f"{mag_rounded} {unit_suffix}"
+
+
+def _axes(ax, show, save_path):
+    """
+    Axes to draw on, whether to show them and where to save them: the axes of a new
+    10 x 5 inch figure if `ax` is None, otherwise `ax` itself, which belongs to the
+    caller's figure and is neither shown nor saved here.
+    """
+
+    if ax is None:
+        _, ax = plt.subplots(figsize=(10, 5))
+        return ax, show, save_path
+    return ax, False, None
+
+
+def _show_or_save(fig, show, save_path):
+    """
+    Save `fig` to `save_path` at 100 dpi and close it, so that plots drawn in a loop
+    do not accumulate open figures, or otherwise show it if requested.
+    """
+
+    if save_path is not None:
+        fig.savefig(save_path, dpi=100)
+        plt.close(fig)
+    elif show:
+        plt.show()
+
+
+def _finish(ax, show, save_path):
+    """
+    Add the legend, show or save the figure if requested and return the axes.
+    """
+
+    ax.legend()
+    _show_or_save(ax.figure, show, save_path)
+    return ax
+
+
+def _altitude_crossing_indices(h_m):
+    """
+    First and last index at or above 5 km and 10 km altitude in the altitude history
+    `h_m` [m], keyed by the altitude in km, or None where the altitude is never reached.
+
+    Climb and descent altitude histories are monotone, so the crossings are found by
+    binary search instead of scanning the whole history.
+    """
+
+    n = h_m.size
+    climbing = h_m[0] <= h_m[-1]
+    indices = {}
+    for threshold_km in (5, 10):
+        if climbing:
+            first = int(np.searchsorted(h_m, threshold_km * 1000.0, side="left"))
+            last = n - 1
+        else:
+            # ascending view of the descent, counting the samples below the threshold
+            below = int(np.searchsorted(h_m[::-1], threshold_km * 1000.0, side="left"))
+            first = 0
+            last = n - below - 1
+        indices[threshold_km] = (first, last) if first <= last else None
+    return indices
+
+
+def _crossing_index(crossing, h_initial_km, threshold_km, phase=None):
+    """
+    Index where the altitude crosses `threshold_km`, given the (first, last) index pair
+    `crossing` from `_altitude_crossing_indices`, or None if it is never reached.
+
+    For the climb phase this is the first sample at or above the threshold, otherwise
+    the last one. Without a phase, it is inferred from the initial altitude.
+    """
+
+    if crossing is None:
+        return None
+    if phase is None:
+        phase = "climb" if h_initial_km < threshold_km else "descent"
+    return crossing[0] if phase == "climb" else crossing[-1]
+
+
+@dataclass(frozen=True)
+class PlotContext:
+    """
+    Plain magnitudes of one result in the plotted units and its altitude crossings,
+    converted once and shared by the plot functions. Histories missing from the
+    result, e.g. the flight path angle of the approach, are None.
+    """
+
+    t_min: np.ndarray  # time [min]
+    h_km: np.ndarray  # altitude [km]
+    x_km: np.ndarray | None  # horizontal distance [km]
+    v_tas_mps: np.ndarray | None  # true airspeed [m/s]
+    fuel_kg: np.ndarray | None  # fuel burn [kg]
+    mach: np.ndarray | None  # Mach number
+    gamma_deg: np.ndarray | None  # flight path angle [deg]
+    idx_5km: int | None  # 5 km crossing, the first index for the climb, else the last
+    idx_10km: int | None  # first index at or above 10 km
+
+
+def make_context(result, phase=None):
+    """
+    Build the `PlotContext` of `result`, e.g. once for all plots of a report.
+
+    Parameters:
+        result (dict): Simulation results as returned by `load_or_run_simulation`.
+        phase (str, optional): The flight phase of the results, which selects the
+            5 km crossing. By default it is inferred from the initial altitude.
+
+    Returns:
+        PlotContext: The magnitudes and crossing indices of `result`.
+    """
+
+    def magnitude(key, unit):
+        return result[key].to(unit).magnitude if key in result else None
+
+    # the approach stores IAS only, its TAS follows from the SI core over the plain
+    # IAS and altitude arrays, with no Quantity in between
+    if "v_tas" in result:
+        v_tas_mps = result["v_tas"].to(_MPS).magnitude
+    elif "v_ias" in result:
+        v_tas_mps = _cas2tas_si_array(
+            np.asarray(result["v_ias"].to(_MPS).magnitude, dtype=float),
+            np.asarray(result["h"].to(_M).magnitude, dtype=float),
+        )
+    else:
+        v_tas_mps = None
+    gamma_rad = magnitude("gamma", _RAD)
+    h_km = result["h"].to(_KM).magnitude
+    crossings = _altitude_crossing_indices(result["h"].to(_M).magnitude)
+
+    return PlotContext(
+        t_min=result["t"].to(_MIN).magnitude,
+        h_km=h_km,
+        x_km=magnitude("x", _KM),
+        v_tas_mps=v_tas_mps,
+        fuel_kg=magnitude("fuel_burn", _KG),
+        mach=magnitude("mach", ureg.dimensionless),
+        gamma_deg=None if gamma_rad is None else np.degrees(gamma_rad),
+        idx_5km=_crossing_index(crossings[5], h_km[0], 5, phase),
+        idx_10km=None if crossings[10] is None else crossings[10][0],
+    )
+
+
+def _common_grid(ax):
+    """
+    Add the major and minor gridlines shared by all plots.
+    """
+
+    ax.grid(which="major", color="k", linestyle="-.", linewidth=0.5)
+    ax.grid(which="minor", color="gray", linestyle=":", linewidth=0.4)
+    ax.minorticks_on()
+
+
+def _prepare_time_axis(ax, t_min, y, label, title, ylabel):
+    """
+    Plot `y` over the time `t_min` [min] with its title, axis labels and grid.
+    """
+
+    ax.plot(t_min, y, label=label)
+    ax.set_title(title)
+    ax.set_xlabel("Time [min]")
+    ax.set_ylabel(ylabel)
+
+    # Add major and minor gridlines
+    _common_grid(ax)
+
+
+def _annotate_endpoints(ax, t_min, y, texts, offsets, colors):
+    """
+    Annotate the first and last point of `y` over `t_min`. `texts`, `offsets` and
+    `colors` hold the text, the (time [min], y) offset of the text from the point and
+    the `_ANNOTATION_STYLES` color of the start and of the end annotation.
+    """
+
+    for i, text, (dt, dy), color in zip((0, -1), texts, offsets, colors):
+        arrowprops, bbox = _ANNOTATION_STYLES[color]
+        ax.annotate(
+            text,
+            xy=(t_min[i], y[i]),
+            xytext=(t_min[i] + dt, y[i] + dy),
+            arrowprops=arrowprops,
+            bbox=bbox,
+        )
+
+
+# the plots annotated with double arrows from the initial value, keyed by their kind,
+# i.e. the name of their `plot_<kind>` function. See `PlotAnnotator` for the fields.
+_XY_PLOTS = {
+    "horizontal_distance_vs_time": dict(
+        x="t_min",
+        y="x_km",
+        unit="km",
+        title="Horiz. distance travelled relative to the ground vs Time",
+        label="Horizontal Distance",
+        xlabel="Time [min]",
+        ylabel="Horizontal distance [km]",
+        span="y",
+        text="Distance {value}",
+        crossing_text="Distance {value} @ {km} km",
+        arrow_style=dict(ls="-.", lw=1),
+    ),
+    "altitude_vs_time": dict(
+        x="t_min",
+        y="h_km",
+        unit="min",
+        title="Altitude vs Time",
+        label="Altitude",
+        xlabel="Time [min]",
+        ylabel="Altitude [km]",
+        span="x",
+        text="Time {value}",
+        crossing_text="Time {value} @ {km} km",
+        arrow_style=dict(ls="-.", lw=1),
+    ),
+    "altitude_vs_distance": dict(
+        x="x_km",
+        y="h_km",
+        unit="km",
+        title="Altitude vs Horiz. Distance",
+        label="Altitude vs Distance",
+        xlabel="Horizontal distance [km]",
+        ylabel="Altitude [km]",
+        span="x",
+        text="Distance {value}",
+        crossing_text="Distance {value} @ {km} km",
+        arrow_style=dict(ls="-.", lw=1),
+        # Offset text vertically for better visibility
+        crossing_text_dy=-_VY_OFFSET,
+    ),
+    "fuel_burn_vs_time": dict(
+        x="t_min",
+        y="fuel_kg",
+        unit="kg",
+        title="Fuel Burn vs Time",
+        label="Fuel Burn",
+        xlabel="Time [min]",
+        ylabel="Fuel burn [kg]",
+        span="y",
+        text="Total Fuel Burn: {value}",
+        crossing_text="Fuel Burn to {km} km Altitude: {value}",
+        arrow_style=dict(lw=1.5),
+        text_style=dict(verticalalignment="center"),
+    ),
+}
+
+
+class PlotAnnotator:
+    """
+    One of the double-arrow plots, kept on its axes and redrawn in place for new
+    results.
+
+    Plots the `PlotContext` field `y` over the field `x` and annotates the total change
+    of one of them, plus its change up to the 5 km altitude crossing. `span` selects
+    the annotated variable, "x" or "y". Its change is drawn as a double arrow from the
+    initial value, labelled with `text` (formatted with `value`) for the total and
+    `crossing_text` (formatted with `value` and `km`) for the crossing, `value` being
+    rounded to 0.1 and followed by `unit`.
+
+    The line, arrows and texts are created once. `update` moves them to a new result
+    with `Line2D.set_data` and schedules a redraw with `canvas.draw_idle`, so
+    interactive or repeated re-plots (e.g. of a parameter sweep) skip building a new
+    figure per result.
+
+    Parameters:
+        kind (str): The plot to draw, the name of its `plot_<kind>` function, e.g.
+            "altitude_vs_time". See `_XY_PLOTS`.
+        ax (matplotlib.axes.Axes, optional): Axes to draw on. By default a new
+            10 x 5 inch figure is created.
+
+    Example:
+        >>> annotator = PlotAnnotator("altitude_vs_time")
+        >>> for result in results:
+        ...     annotator.update(result)
+    """
+
+    def __init__(self, kind, ax=None):
+        _ensure_mpl()
+        spec = _XY_PLOTS[kind]
+        self.kind = kind
+        self.x = spec["x"]
+        self.y = spec["y"]
+        self.unit = spec["unit"]
+        self.span = spec["span"]
+        self.text = spec["text"]
+        self.crossing_text = spec["crossing_text"]
+        self.arrow_style = spec.get("arrow_style", {})
+        self.text_style = spec.get("text_style", {})
+        self.crossing_text_dy = spec.get("crossing_text_dy")
+
+        self.ax, _, _ = _axes(ax, False, None)
+        self.fig = self.ax.figure
+        (self.line,) = self.ax.plot([], [], label=spec["label"])
+        self.ax.set_title(spec["title"])
+        self.ax.set_xlabel(spec["xlabel"])
+        self.ax.set_ylabel(spec["ylabel"])
+        _common_grid(self.ax)
+        self.ax.legend()
+
+        # (arrow, text) handles of the total change, and of the 5 km crossing once it
+        # is reached by a result
+        self.total = self._arrow_and_text("r", "wheat")
+        self.crossing = None
+
+    def _arrow_and_text(self, color, face):
+        """
+        Create a double-headed arrow and a boxed, centred text, positioned by `update`.
+        """
+
+        arrow = self.ax.annotate(
+            "",
+            xy=(0, 0),
+            xytext=(0, 0),
+            arrowprops=dict(arrowstyle="<->", color=color, **self.arrow_style),
+        )
+        text = self.ax.text(
+            0,
+            0,
+            "",
+            horizontalalignment="center",
+            bbox=dict(facecolor=face, alpha=0.5),
+            **self.text_style,
+        )
+        return arrow, text
+
+    @staticmethod
+    def _place(handles, xy, xytext, label, dy=None):
+        """
+        Move a double arrow to span `xy` - `xytext` and its text to the midpoint,
+        optionally shifted vertically by `dy`.
+        """
+
+        arrow, text = handles
+        arrow.xy = xy
+        arrow.set_position(xytext)
+        x = (xy[0] + xytext[0]) / 2
+        y = (xy[1] + xytext[1]) / 2
+        if dy is not None:
+            y = y + dy
+        text.set_position((x, y))
+        text.set_text(label)
+        arrow.set_visible(True)
+        text.set_visible(True)
+
+    def update(self, result, ctx=None):
+        """
+        Redraw the plot and its annotations for `result` and return the axes. `ctx` is
+        the `PlotContext` of `result`, built here if not given.
+        """
+
+        if ctx is None:
+            ctx = make_context(result)
+        x = getattr(ctx, self.x)
+        y = getattr(ctx, self.y)
+        span_mag = x if self.span == "x" else y
+
+        def span_points(i):
+            # the point at index i and its projection onto the initial value
+            if self.span == "x":
+                return (x[i], y[i]), (x[0], y[i])
+            return (x[i], y[i]), (x[i], y[0])
+
+        self.line.set_data(x, y)
+
+        # Move annotation for the total change
+        point, base = span_points(-1)
+        # a horizontal total arrow is drawn from the initial value to the end point
+        xy, xytext = (base, point) if self.span == "x" else (point, base)
+        value = _fmt(np.round(span_mag[-1], 1), self.unit)
+        self._place(self.total, xy, xytext, self.text.format(value=value))
+
+        # Move annotation and text for the change up to the 5 km altitude crossing
+        index = ctx.idx_5km
+        if index is None:
+            if self.crossing is not None:
+                for artist in self.crossing:
+                    artist.set_visible(False)
+        else:
+            if self.crossing is None:
+                self.crossing = self._arrow_and_text("b", "lightblue")
+            point, base = span_points(index)
+            value = _fmt(np.round(span_mag[index], 1), self.unit)
+            self._place(
+                self.crossing,
+                point,
+                base,
+                self.crossing_text.format(value=value, km=5),
+                dy=self.crossing_text_dy,
+            )
+
+        self.ax.relim()
+        self.ax.autoscale_view()
+        self.fig.canvas.draw_idle()
+        return self.ax
 
-ureg.setup_matplotlib(True)  # Enable matplotlib integration
-# Optional: Set a custom formatter for unit-aware labels
-ureg.mpl_formatter = "{:~P}"  # Compact formatting for units (e.g., 'km', 'min')
 
+def _plot_xy_with_crossings(result, kind, ctx=None, ax=None, show=True, save_path=None):
+    """
+    One-shot `PlotAnnotator` of `kind` for `result`. Draws on `ax` and returns it as
+    the public plot functions do.
+    """
+
+    ax, show, save_path = _axes(ax, show, save_path)
+    PlotAnnotator(kind, ax=ax).update(result, ctx)
+    _show_or_save(ax.figure, show, save_path)
+    return ax
 
-def plot_horizontal_distance_vs_time(result):
+
+def plot_horizontal_distance_vs_time(
+    result, *, ctx=None, ax=None, show=True, save_path=None
+):
     """
     Plots the horizontal distance traveled relative to the ground versus time.
 
@@ -28,6 +505,17 @@ def plot_horizontal_distance_vs_time(result):
             Horizontal distance data (assumed to be in units compatible with `ureg.km`).
         - "h" : array-like
             Altitude data (assumed to be in units compatible with `ureg.km`).
+    ax : matplotlib.axes.Axes, optional
+        Axes to draw on. By default the plot gets a new figure of its own.
+    show : bool, optional
+        Whether to show the new figure, True by default. Axes passed in through `ax`
+        belong to the caller's figure and are never shown or saved here.
+    save_path : str or path-like, optional
+        File to save the new figure to at 100 dpi instead of showing it. The figure is
+        closed afterwards.
+    ctx : PlotContext, optional
+        Magnitudes and altitude crossings of `result`, see `make_context`. Built here
+        if not given.
 
     Notes:
     ------
@@ -40,64 +528,21 @@ def plot_horizontal_distance_vs_time(result):
 
     Returns:
     --------
-    None
-        The function displays the plot but does not return any value.
+    matplotlib.axes.Axes
+        The axes the plot is drawn on.
     """
-    fig, ax = plt.subplots(figsize=(10, 5))
-    ax.plot(result["t"], result["x"], label="Horizontal Distance")
-    ax.set_title("Horiz. distance travelled relative to the ground vs Time")
-    ax.xaxis.set_units(ureg.min)
-    ax.yaxis.set_units(ureg.km)
-
-    # Add major and minor gridlines
-    ax.grid(which="major", color="k", linestyle="-.", linewidth=0.5)
-    ax.grid(which="minor", color="gray", linestyle=":", linewidth=0.4)
-    ax.minorticks_on()
-
-    # Add annotation for total distance
-    ax.annotate(
-        "",
-        xy=(result["t"][-1], result["x"][-1]),
-        xytext=(result["t"][-1], result["x"][0]),
-        arrowprops=dict(arrowstyle="<->", ls="-.", lw=1, color="r"),
-    )
-    ax.text(
-        result["t"][-1],
-        (result["x"][0] + result["x"][-1]) / 2,
-        f"Distance {np.round(result['x'][-1].to(ureg.km), 1):~}",
-        rotation=0,
-        horizontalalignment="center",
-        bbox=dict(facecolor="wheat", alpha=0.5),
+    _ensure_mpl()
+    return _plot_xy_with_crossings(
+        result,
+        "horizontal_distance_vs_time",
+        ctx,
+        ax=ax,
+        show=show,
+        save_path=save_path,
     )
 
-    # Add annotation and text for horizontal distance at altitude of 5 km
-    altitude_5km_indices = np.where(result["h"] >= 5 * ureg.km)[0]
-    if len(altitude_5km_indices) > 0:
-        altitude_5km_index = (
-            altitude_5km_indices[0]
-            if result["h"][0] < 5 * ureg.km
-            else altitude_5km_indices[-1]
-        )
-        ax.annotate(
-            "",
-            xy=(result["t"][altitude_5km_index], result["x"][altitude_5km_index]),
-            xytext=(result["t"][altitude_5km_index], result["x"][0]),
-            arrowprops=dict(arrowstyle="<->", ls="-.", lw=1, color="b"),
-        )
-        ax.text(
-            result["t"][altitude_5km_index],
-            (result["x"][0] + result["x"][altitude_5km_index]) / 2,
-            f"Distance {np.round(result['x'][altitude_5km_index].to(ureg.km), 1):~} @ 5 km",
-            rotation=0,
-            horizontalalignment="center",
-            bbox=dict(facecolor="lightblue", alpha=0.5),
-        )
-
-    plt.legend()
-    plt.show()
-
 
-def plot_altitude_vs_time(result):
+def plot_altitude_vs_time(result, *, ctx=None, ax=None, show=True, save_path=None):
     """
     Plots altitude versus time and adds annotations for total time and time to reach an altitude of 5 km (if applicable).
 
@@ -107,6 +552,17 @@ def plot_altitude_vs_time(result):
         A dictionary containing the following keys:
         - "t": array-like, time values with units (e.g., seconds or minutes).
         - "h": array-like, altitude values with units (e.g., meters or kilometers).
+    ax : matplotlib.axes.Axes, optional
+        Axes to draw on. By default the plot gets a new figure of its own.
+    show : bool, optional
+        Whether to show the new figure, True by default. Axes passed in through `ax`
+        belong to the caller's figure and are never shown or saved here.
+    save_path : str or path-like, optional
+        File to save the new figure to at 100 dpi instead of showing it. The figure is
+        closed afterwards.
+    ctx : PlotContext, optional
+        Magnitudes and altitude crossings of `result`, see `make_context`. Built here
+        if not given.
 
     Description:
     ------------
@@ -124,63 +580,16 @@ def plot_altitude_vs_time(result):
 
     Returns:
     --------
-    None
+    matplotlib.axes.Axes
+        The axes the plot is drawn on.
     """
-    fig, ax = plt.subplots(figsize=(10, 5))
-    ax.plot(result["t"], result["h"], label="Altitude")
-    ax.set_title("Altitude vs Time")
-    ax.xaxis.set_units(ureg.min)
-    ax.yaxis.set_units(ureg.km)
-
-    # Add major and minor gridlines
-    ax.grid(which="major", color="k", linestyle="-.", linewidth=0.5)
-    ax.grid(which="minor", color="gray", linestyle=":", linewidth=0.4)
-    ax.minorticks_on()
-
-    # Add annotation for total time
-    ax.annotate(
-        "",
-        xy=(result["t"][0], result["h"][-1]),
-        xytext=(result["t"][-1], result["h"][-1]),
-        arrowprops=dict(arrowstyle="<->", ls="-.", lw=1, color="r"),
-    )
-    ax.text(
-        (result["t"][0] + result["t"][-1]) / 2,
-        result["h"][-1],
-        f"Time {np.round(result['t'][-1].to(ureg.min), 1):~}",
-        rotation=0,
-        horizontalalignment="center",
-        bbox=dict(facecolor="wheat", alpha=0.5),
+    _ensure_mpl()
+    return _plot_xy_with_crossings(
+        result, "altitude_vs_time", ctx, ax=ax, show=show, save_path=save_path
     )
 
-    # Add annotation and text for time at altitude of 5 km
-    altitude_5km_indices = np.where(result["h"] >= 5 * ureg.km)[0]
-    if len(altitude_5km_indices) > 0:
-        altitude_5km_index = (
-            altitude_5km_indices[0]
-            if result["h"][0] < 5 * ureg.km
-            else altitude_5km_indices[-1]
-        )
-        ax.annotate(
-            "",
-            xy=(result["t"][altitude_5km_index], result["h"][altitude_5km_index]),
-            xytext=(result["t"][0], result["h"][altitude_5km_index]),
-            arrowprops=dict(arrowstyle="<->", ls="-.", lw=1, color="b"),
-        )
-        ax.text(
-            (result["t"][0] + result["t"][altitude_5km_index]) / 2,
-            result["h"][altitude_5km_index],
-            f"Time {np.round(result['t'][altitude_5km_index].to(ureg.min), 1):~} @ 5 km",
-            rotation=0,
-            horizontalalignment="center",
-            bbox=dict(facecolor="lightblue", alpha=0.5),
-        )
-
-    plt.legend()
-    plt.show()
-
 
-def plot_altitude_vs_distance(result):
+def plot_altitude_vs_distance(result, *, ctx=None, ax=None, show=True, save_path=None):
     """
     Plots the altitude versus horizontal distance from the given simulation results.
 
@@ -196,6 +605,17 @@ def plot_altitude_vs_distance(result):
         A dictionary containing the simulation results with the following keys:
         - "x": Array-like, horizontal distance values (with units).
         - "h": Array-like, altitude values (with units).
+    ax : matplotlib.axes.Axes, optional
+        Axes to draw on. By default the plot gets a new figure of its own.
+    show : bool, optional
+        Whether to show the new figure, True by default. Axes passed in through `ax`
+        belong to the caller's figure and are never shown or saved here.
+    save_path : str or path-like, optional
+        File to save the new figure to at 100 dpi instead of showing it. The figure is
+        closed afterwards.
+    ctx : PlotContext, optional
+        Magnitudes and altitude crossings of `result`, see `make_context`. Built here
+        if not given.
 
     Notes:
     ------
@@ -205,65 +625,18 @@ def plot_altitude_vs_distance(result):
 
     Returns:
     --------
-    None
-        Displays the plot directly.
+    matplotlib.axes.Axes
+        The axes the plot is drawn on.
     """
-    fig, ax = plt.subplots(figsize=(10, 5))
-    ax.plot(result["x"], result["h"], label="Altitude vs Distance")
-    ax.set_title("Altitude vs Horiz. Distance")
-    ax.xaxis.set_units(ureg.km)
-    ax.yaxis.set_units(ureg.km)
-
-    # Add major and minor gridlines
-    ax.grid(which="major", color="k", linestyle="-.", linewidth=0.5)
-    ax.grid(which="minor", color="gray", linestyle=":", linewidth=0.4)
-    ax.minorticks_on()
-
-    # Add annotation for total distance
-    ax.annotate(
-        "",
-        xy=(result["x"][0], result["h"][-1]),
-        xytext=(result["x"][-1], result["h"][-1]),
-        arrowprops=dict(arrowstyle="<->", ls="-.", lw=1, color="r"),
-    )
-    ax.text(
-        (result["x"][0] + result["x"][-1]) / 2,
-        result["h"][-1],
-        f"Distance {np.round(result['x'][-1].to(ureg.km), 1):~}",
-        rotation=0,
-        horizontalalignment="center",
-        bbox=dict(facecolor="wheat", alpha=0.5),
+    _ensure_mpl()
+    return _plot_xy_with_crossings(
+        result, "altitude_vs_distance", ctx, ax=ax, show=show, save_path=save_path
     )
 
-    # Add annotation and text for distance at altitude of 5 km
-    altitude_5km_indices = np.where(result["h"] >= 5 * ureg.km)[0]
-    if len(altitude_5km_indices) > 0:
-        altitude_5km_index = (
-            altitude_5km_indices[0]
-            if result["h"][0] < 5 * ureg.km
-            else altitude_5km_indices[-1]
-        )
-        ax.annotate(
-            "",
-            xy=(result["x"][altitude_5km_index], result["h"][altitude_5km_index]),
-            xytext=(result["x"][0], result["h"][altitude_5km_index]),
-            arrowprops=dict(arrowstyle="<->", ls="-.", lw=1, color="b"),
-        )
-        ax.text(
-            (result["x"][0] + result["x"][altitude_5km_index]) / 2,
-            result["h"][altitude_5km_index]
-            - 0.5 * ureg.km,  # Offset text vertically for better visibility
-            f"Distance {np.round(result['x'][altitude_5km_index].to(ureg.km), 1):~} @ 5 km",
-            rotation=0,
-            horizontalalignment="center",
-            bbox=dict(facecolor="lightblue", alpha=0.5),
-        )
 
-    plt.legend()
-    plt.show()
-
-
-def plot_altitude_vs_tas(result, phase):
+def plot_altitude_vs_tas(
+    result, phase, *, ctx=None, ax=None, show=True, save_path=None
+):
     """
     Plots altitude versus true airspeed (TAS) for a given flight phase.
 
@@ -286,6 +659,17 @@ def plot_altitude_vs_tas(result, phase):
         - "climb": Adds annotations for TAS at initial altitude and crossover altitude.
         - "descent": Adds annotations for TAS at final altitude.
         - "descent_approach": Computes TAS from IAS and altitude, and adds annotations.
+    ax : matplotlib.axes.Axes, optional
+        Axes to draw on. By default the plot gets a new figure of its own.
+    show : bool, optional
+        Whether to show the new figure, True by default. Axes passed in through `ax`
+        belong to the caller's figure and are never shown or saved here.
+    save_path : str or path-like, optional
+        File to save the new figure to at 100 dpi instead of showing it. The figure is
+        closed afterwards.
+    ctx : PlotContext, optional
+        Magnitudes and altitude crossings of `result`, see `make_context`. Built here
+        if not given.
 
     Annotations:
     ------------
@@ -297,116 +681,63 @@ def plot_altitude_vs_tas(result, phase):
 
     Returns:
     --------
-    None
-        Displays the plot with annotations.
+    matplotlib.axes.Axes
+        The axes the plot is drawn on.
 
     Notes:
     ------
     - The function uses `pint`'s `ureg` for unit handling.
-    - The `cas2tas` function is used to compute TAS from IAS and altitude
-      during the "descent_approach" phase.
+    - The TAS of the "descent_approach" phase is computed from IAS and altitude by
+      `make_context`, in a single call of the array `cas2tas` core.
     - The plot includes major and minor gridlines for better readability.
     """
-    fig, ax = plt.subplots(figsize=(10, 5))
-    tas = (
-        ureg.Quantity.from_list(
-            [cas2tas(v_ias, h) for v_ias, h in zip(result["v_ias"], result["h"])]
-        )
-        if phase == "descent_approach"
-        else result["v_tas"]
-    )
-    ax.plot(np.round(tas, 1), result["h"], label="Altitude vs TAS")
+    _ensure_mpl()
+    if ctx is None:
+        ctx = make_context(result, phase)
+    ax, show, save_path = _axes(ax, show, save_path)
+    tas_mps = ctx.v_tas_mps
+    h_km = ctx.h_km
+    ax.plot(np.round(tas_mps, 1), h_km, label="Altitude vs TAS")
     ax.set_title("Altitude vs True Airspeed")
-    ax.xaxis.set_units(ureg.m / ureg.s)
-    ax.yaxis.set_units(ureg.km)
+    ax.set_xlabel("TAS [m/s]")
+    ax.set_ylabel("Altitude [km]")
 
     # Add major and minor gridlines
-    ax.grid(which="major", color="k", linestyle="-.", linewidth=0.5)
-    ax.grid(which="minor", color="gray", linestyle=":", linewidth=0.4)
-    ax.minorticks_on()
+    _common_grid(ax)
 
-    # Add annotation for TAS at 5 km altitude
-    altitude_5km_indices = np.where(result["h"] >= 5 * ureg.km)[0]
-    if len(altitude_5km_indices) > 0:
-        altitude_5km_index = (
-            altitude_5km_indices[0] if phase == "climb" else altitude_5km_indices[-1]
-        )
-        tas_5km = tas[altitude_5km_index]
+    def annotate_tas(i, prefix, color, face):
         ax.annotate(
-            f"TAS: {np.round(tas_5km.to(ureg.m / ureg.s), 1):~}\n@ Alt: {np.round(result['h'][altitude_5km_index].to(ureg.km), 1):~}",
-            xy=(tas_5km, result["h"][altitude_5km_index]),
-            xytext=(
-                tas_5km + 10 * ureg.m / ureg.s,
-                result["h"][altitude_5km_index] - 0.5 * ureg.km,
-            ),
-            arrowprops=dict(facecolor="blue", arrowstyle="->"),
-            bbox=dict(facecolor="lightblue", alpha=0.5, edgecolor="blue"),
+            f"{prefix}: {_fmt(np.round(tas_mps[i], 1), 'm / s')}\n@ Alt: {_fmt(np.round(h_km[i], 1), 'km')}",
+            xy=(tas_mps[i], h_km[i]),
+            xytext=(tas_mps[i] + _MS_OFFSET, h_km[i] - _VY_OFFSET),
+            arrowprops=dict(facecolor=color, arrowstyle="->"),
+            bbox=dict(facecolor=face, alpha=0.5, edgecolor=color),
         )
 
+    # Add annotation for TAS at 5 km altitude
+    if ctx.idx_5km is not None:
+        annotate_tas(ctx.idx_5km, "TAS", "blue", "lightblue")
+
     # Add annotation for TAS at 10 km altitude
-    altitude_10km_indices = np.where(result["h"] >= 10 * ureg.km)[0]
-    if len(altitude_10km_indices) > 0:
-        altitude_10km_index = altitude_10km_indices[0]
-        tas_10km = tas[altitude_10km_index]
-        ax.annotate(
-            f"TAS: {np.round(tas_10km.to(ureg.m / ureg.s), 1):~}\n@ Alt: {np.round(result['h'][altitude_10km_index].to(ureg.km), 1):~}",
-            xy=(tas_10km, result["h"][altitude_10km_index]),
-            xytext=(
-                tas_10km + 10 * ureg.m / ureg.s,
-                result["h"][altitude_10km_index] - 0.5 * ureg.km,
-            ),
-            arrowprops=dict(facecolor="green", arrowstyle="->"),
-            bbox=dict(facecolor="lightgreen", alpha=0.5, edgecolor="green"),
-        )
+    if ctx.idx_10km is not None:
+        annotate_tas(ctx.idx_10km, "TAS", "green", "lightgreen")
 
     # Add annotation for crossover altitude (where TAS is maximum)
     if phase != "descent_approach":
-        max_tas_index = np.argmax(tas)
-        max_tas = tas[max_tas_index]
-        crossover_altitude = result["h"][max_tas_index]
-        ax.annotate(
-            f"Crossover TAS: {np.round(max_tas.to(ureg.m / ureg.s), 1):~}\n@ Alt: {np.round(crossover_altitude.to(ureg.km), 1):~}",
-            xy=(max_tas, crossover_altitude),
-            xytext=(max_tas + 10 * ureg.m / ureg.s, crossover_altitude - 0.5 * ureg.km),
-            arrowprops=dict(facecolor="red", arrowstyle="->"),
-            bbox=dict(facecolor="lightcoral", alpha=0.5, edgecolor="red"),
-        )
+        annotate_tas(int(np.argmax(tas_mps)), "Crossover TAS", "red", "lightcoral")
 
     # for climb phase, add annotation for TAS at initial altitude
     if phase == "climb":
-        initial_tas = tas[0]
-        initial_altitude = result["h"][0]
-        ax.annotate(
-            f"TAS: {np.round(initial_tas.to(ureg.m / ureg.s), 1):~}\n@ Alt: {np.round(initial_altitude.to(ureg.km), 1):~}",
-            xy=(initial_tas, initial_altitude),
-            xytext=(
-                initial_tas + 10 * ureg.m / ureg.s,
-                initial_altitude - 0.5 * ureg.km,
-            ),
-            arrowprops=dict(facecolor="purple", arrowstyle="->"),
-            bbox=dict(facecolor="purple", alpha=0.5, edgecolor="purple"),
-        )
+        annotate_tas(0, "TAS", "purple", "purple")
 
     # for descent phase, add annotation for TAS at final altitude
     if phase == "descent":
-        final_tas = tas[-1]
-        final_altitude = result["h"][-1]
-        ax.annotate(
-            f"TAS: {np.round(final_tas.to(ureg.m / ureg.s), 1):~}\n@ Alt: {np.round(final_altitude.to(ureg.km), 1):~}",
-            xy=(final_tas, final_altitude),
-            xytext=(
-                final_tas + 10 * ureg.m / ureg.s,
-                final_altitude - 0.5 * ureg.km,
-            ),
-            arrowprops=dict(facecolor="purple", arrowstyle="->"),
-            bbox=dict(facecolor="purple", alpha=0.5, edgecolor="purple"),
-        )
+        annotate_tas(-1, "TAS", "purple", "purple")
 
-    plt.legend()
-    plt.show()
+    return _finish(ax, show, save_path)
 
 
-def plot_mach_vs_time(result):
+def plot_mach_vs_time(result, *, ctx=None, ax=None, show=True, save_path=None):
     """
     Plots the Mach number versus time and annotates the point where the Mach number
     first reaches or leaves the constant cruise Mach of 0.85.
@@ -419,6 +750,17 @@ def plot_mach_vs_time(result):
             Time values (assumed to be in compatible units with `ureg`).
         - "mach" : array-like
             Corresponding Mach number values.
+    ax : matplotlib.axes.Axes, optional
+        Axes to draw on. By default the plot gets a new figure of its own.
+    show : bool, optional
+        Whether to show the new figure, True by default. Axes passed in through `ax`
+        belong to the caller's figure and are never shown or saved here.
+    save_path : str or path-like, optional
+        File to save the new figure to at 100 dpi instead of showing it. The figure is
+        closed afterwards.
+    ctx : PlotContext, optional
+        Magnitudes and altitude crossings of `result`, see `make_context`. Built here
+        if not given.
 
     Notes:
     ------
@@ -430,37 +772,42 @@ def plot_mach_vs_time(result):
 
     Returns:
     --------
-    None
-        Displays the plot with annotations.
+    matplotlib.axes.Axes
+        The axes the plot is drawn on.
     """
-    fig, ax = plt.subplots(figsize=(10, 5))
-    ax.plot(result["t"], result["mach"], label="Mach Number")
+    _ensure_mpl()
+    if ctx is None:
+        ctx = make_context(result)
+    t_min = ctx.t_min
+    mach = ctx.mach
+
+    ax, show, save_path = _axes(ax, show, save_path)
+    ax.plot(t_min, mach, label="Mach Number")
     ax.set_title("Mach number vs Time")
-    ax.xaxis.set_units(ureg.min)
+    ax.set_xlabel("Time [min]")
     ax.set_ylabel("Mach")
 
     # Add major and minor gridlines
-    ax.grid(which="major", color="k", linestyle="-.", linewidth=0.5)
-    ax.grid(which="minor", color="gray", linestyle=":", linewidth=0.4)
-    ax.minorticks_on()
+    _common_grid(ax)
 
     # Find the time when Mach first reaches constant cruise Mach of 0.85
     cruise_mach = 0.85
-    rounded_mach = np.round(result["mach"], 2)  # Round Mach values to 2 decimal places
-    mach_indices = np.where(rounded_mach >= cruise_mach)[0]
-    if len(mach_indices) > 0:
-        if result["mach"][0] < cruise_mach:  # Climb phase
-            start_time = result["t"][mach_indices[0]]
-            annotation_text = "Crossover to Cruise Mach"
-            text_offset = -0.2
-        else:  # Descent phase
-            start_time = result["t"][mach_indices[-1]]
-            annotation_text = "Crossover from Cruise Mach"
-            text_offset = 0.2
+    # Mach values reach cruise Mach once they round to 0.85 at 2 decimal places, i.e.
+    # once they exceed 0.845. The histories oscillate, so instead of a binary search
+    # the first (climb) or last (descent) such sample is found with argmax, which
+    # stops at the first True of the mask.
+    if mach[0] < cruise_mach:  # Climb phase
+        start_index = int(np.argmax(mach > _MACH_CROSSOVER))
+        annotation_text = "Crossover to Cruise Mach"
+    else:  # Descent phase
+        start_index = mach.size - 1 - int(np.argmax(mach[::-1] > _MACH_CROSSOVER))
+        annotation_text = "Crossover from Cruise Mach"
+    if mach[start_index] > _MACH_CROSSOVER:
+        start_time = t_min[start_index]
 
         # Add annotation with arrow pointing from text to the point
         ax.annotate(
-            f"Time: {np.round(start_time.to(ureg.min), 1):~}\n{annotation_text}",
+            f"Time: {_fmt(np.round(t_min[start_index], 1), 'min')}\n{annotation_text}",
             xy=(start_time, cruise_mach),  # Point of interest
             xytext=(
                 start_time,
@@ -473,11 +820,10 @@ def plot_mach_vs_time(result):
             color="blue",
         )
 
-    plt.legend()
-    plt.show()
+    return _finish(ax, show, save_path)
 
 
-def plot_tas_vs_time(result, phase):
+def plot_tas_vs_time(result, phase, *, ctx=None, ax=None, show=True, save_path=None):
     """
     Plots True Airspeed (TAS) versus time with annotations for key points.
 
@@ -487,6 +833,15 @@ def plot_tas_vs_time(result, phase):
             - "v_tas": Array of True Airspeed (TAS) values (assumed to be in units compatible with `ureg`).
             - "h": Array of altitude values (assumed to be in units compatible with `ureg`).
         phase (str): The flight phase, either "climb" or "descent". Determines annotation positioning.
+        ax (matplotlib.axes.Axes, optional): Axes to draw on. By default the plot gets
+            a new figure of its own.
+        show (bool, optional): Whether to show the new figure, True by default. Axes
+            passed in through `ax` belong to the caller's figure and are never shown or
+            saved here.
+        save_path (str or path-like, optional): File to save the new figure to at 100 dpi
+            instead of showing it. The figure is closed afterwards.
+        ctx (PlotContext, optional): Magnitudes and altitude crossings of `result`, see
+            `make_context`. Built here if not given.
 
     Annotations:
         - Crossover TAS: The maximum TAS value in the dataset.
@@ -499,76 +854,78 @@ def plot_tas_vs_time(result, phase):
         - Units for axes are set using `ureg` (assumed to be a Pint UnitRegistry instance).
 
     Returns:
-        None: Displays the plot with annotations.
+        matplotlib.axes.Axes: The axes the plot is drawn on.
     """
-    fig, ax = plt.subplots(figsize=(10, 5))
-    ax.plot(result["t"], result["v_tas"], label="True Airspeed")
+    _ensure_mpl()
+    if ctx is None:
+        ctx = make_context(result, phase)
+    t_min = ctx.t_min
+    v_tas_mps = ctx.v_tas_mps
+
+    ax, show, save_path = _axes(ax, show, save_path)
+    ax.plot(t_min, v_tas_mps, label="True Airspeed")
     ax.set_title("TAS vs Time")  # Add padding to avoid overlap with annotations
-    ax.xaxis.set_units(ureg.min)
-    ax.yaxis.set_units(ureg.m / ureg.s)
+    ax.set_xlabel("Time [min]")
+    ax.set_ylabel("TAS [m/s]")
 
     # Add major and minor gridlines
-    ax.grid(which="major", color="k", linestyle="-.", linewidth=0.5)
-    ax.grid(which="minor", color="gray", linestyle=":", linewidth=0.4)
-    ax.minorticks_on()
+    _common_grid(ax)
 
     # Add annotation for crossover TAS (where TAS is maximum)
-    max_tas = max(result["v_tas"])
-    max_time = result["t"][np.argmax(result["v_tas"])]
+    max_tas_index = int(np.argmax(v_tas_mps))
+    max_tas = v_tas_mps[max_tas_index]
+    max_time = t_min[max_tas_index]
     ax.annotate(
-        f"Crossover TAS: {np.round(max_tas.to(ureg.m / ureg.s), 1):~}",
+        f"Crossover TAS: {_fmt(np.round(max_tas, 1), 'm / s')}",
         xy=(max_time, max_tas),
         xytext=(
-            max_time - 2 * ureg("min"),
-            max_tas - 15 * ureg("m/s"),
+            max_time - _MIN_OFFSET,
+            max_tas - _MS_OFFSET_CROSSOVER,
         ),  # Adjusted position for better visibility
         arrowprops=dict(facecolor="red", arrowstyle="->"),
         bbox=dict(facecolor="lightcoral", alpha=0.5, edgecolor="red"),
     )
 
     # Add annotation for TAS at 10 km altitude
-    altitude_10km_index = np.where(result["h"] >= 10 * ureg.km)[0][0]
-    tas_10km = result["v_tas"][altitude_10km_index]
-    if phase == "climb":
-        xytext_offset = (
-            result["t"][altitude_10km_index] + 2 * ureg("min"),
-            tas_10km - 10 * ureg("m/s"),
-        )
-    else:  # descent
-        xytext_offset = (
-            result["t"][altitude_10km_index] - 5 * ureg("min"),
-            tas_10km - 10 * ureg("m/s"),
+    altitude_10km_index = ctx.idx_10km
+    if altitude_10km_index is not None:
+        tas_10km = v_tas_mps[altitude_10km_index]
+        if phase == "climb":
+            xytext_offset = (
+                t_min[altitude_10km_index] + _MIN_OFFSET,
+                tas_10km - _MS_OFFSET,
+            )
+        else:  # descent
+            xytext_offset = (
+                t_min[altitude_10km_index] - _MIN_OFFSET_DESCENT,
+                tas_10km - _MS_OFFSET,
+            )
+        ax.annotate(
+            f"TAS: {_fmt(np.round(tas_10km, 1), 'm / s')}\n@ Alt: 10 km",
+            xy=(t_min[altitude_10km_index], tas_10km),
+            xytext=xytext_offset,  # Adjusted position based on phase
+            arrowprops=dict(facecolor="blue", arrowstyle="->"),
+            bbox=dict(facecolor="lightblue", alpha=0.5, edgecolor="blue"),
         )
-    ax.annotate(
-        f"TAS: {np.round(tas_10km.to(ureg.m / ureg.s), 1):~}\n@ Alt: 10 km",
-        xy=(result["t"][altitude_10km_index], tas_10km),
-        xytext=xytext_offset,  # Adjusted position based on phase
-        arrowprops=dict(facecolor="blue", arrowstyle="->"),
-        bbox=dict(facecolor="lightblue", alpha=0.5, edgecolor="blue"),
-    )
 
     # Add annotation for TAS at 5 km altitude
-    altitude_5km_indices = np.where(result["h"] >= 5 * ureg.km)[0]
-    if len(altitude_5km_indices) > 0:
-        altitude_5km_index = (
-            altitude_5km_indices[0] if phase == "climb" else altitude_5km_indices[-1]
-        )
-        tas_5km = result["v_tas"][altitude_5km_index]
+    altitude_5km_index = ctx.idx_5km
+    if altitude_5km_index is not None:
+        tas_5km = v_tas_mps[altitude_5km_index]
         ax.annotate(
-            f"TAS: {np.round(tas_5km.to(ureg.m / ureg.s), 1):~}\n@ Alt: 5 km",
-            xy=(result["t"][altitude_5km_index], tas_5km),
+            f"TAS: {_fmt(np.round(tas_5km, 1), 'm / s')}\n@ Alt: 5 km",
+            xy=(t_min[altitude_5km_index], tas_5km),
             xytext=(
-                result["t"][altitude_5km_index] - 2 * ureg("min"),
-                tas_5km + 10 * ureg("m/s"),
+                t_min[altitude_5km_index] - _MIN_OFFSET,
+                tas_5km + _MS_OFFSET,
             ),  # Adjusted position for better visibility
             arrowprops=dict(facecolor="green", arrowstyle="->"),
             bbox=dict(facecolor="lightgreen", alpha=0.5, edgecolor="green"),
         )
-    plt.legend()
-    plt.show()
+    return _finish(ax, show, save_path)
 
 
-def plot_fuel_burn_vs_time(result):
+def plot_fuel_burn_vs_time(result, *, ctx=None, ax=None, show=True, save_path=None):
     """
     Plots the fuel burn versus time and annotates key information on the plot.
 
@@ -582,6 +939,17 @@ def plot_fuel_burn_vs_time(result):
             Fuel burn values (assumed to be in units compatible with `ureg.kg`).
         - "h" : array-like
             Altitude values (assumed to be in units compatible with `ureg.km`).
+    ax : matplotlib.axes.Axes, optional
+        Axes to draw on. By default the plot gets a new figure of its own.
+    show : bool, optional
+        Whether to show the new figure, True by default. Axes passed in through `ax`
+        belong to the caller's figure and are never shown or saved here.
+    save_path : str or path-like, optional
+        File to save the new figure to at 100 dpi instead of showing it. The figure is
+        closed afterwards.
+    ctx : PlotContext, optional
+        Magnitudes and altitude crossings of `result`, see `make_context`. Built here
+        if not given.
 
     Description:
     ------------
@@ -595,65 +963,16 @@ def plot_fuel_burn_vs_time(result):
 
     Returns:
     --------
-    None
-        Displays the plot.
+    matplotlib.axes.Axes
+        The axes the plot is drawn on.
     """
-    fig, ax = plt.subplots(figsize=(10, 5))
-    ax.plot(result["t"], result["fuel_burn"], label="Fuel Burn")
-    ax.set_title("Fuel Burn vs Time")
-    ax.xaxis.set_units(ureg.min)
-    ax.yaxis.set_units(ureg.kg)
-
-    # Add major and minor gridlines
-    ax.grid(which="major", color="k", linestyle="-.", linewidth=0.5)
-    ax.grid(which="minor", color="gray", linestyle=":", linewidth=0.4)
-    ax.minorticks_on()
-
-    # Add annotation with double arrow
-    total_fuel_burn = result["fuel_burn"][-1]
-    ax.annotate(
-        "",
-        xy=(result["t"][-1], total_fuel_burn),
-        xytext=(result["t"][-1], result["fuel_burn"][0]),
-        arrowprops=dict(arrowstyle="<->", color="r", lw=1.5),
-    )
-    ax.text(
-        result["t"][-1],
-        (result["fuel_burn"][0] + total_fuel_burn) / 2,
-        f"Total Fuel Burn: {np.round(total_fuel_burn.to(ureg.kg), 1):~}",
-        horizontalalignment="center",
-        verticalalignment="center",
-        bbox=dict(facecolor="wheat", alpha=0.5),
+    _ensure_mpl()
+    return _plot_xy_with_crossings(
+        result, "fuel_burn_vs_time", ctx, ax=ax, show=show, save_path=save_path
     )
 
-    # Add annotation for fuel burn at altitude of 5 km
-    altitude_5km_indices = np.where(result["h"] >= 5 * ureg.km)[0]
-    if len(altitude_5km_indices) > 0:
-        altitude_5km_index = (
-            altitude_5km_indices[0]
-            if result["h"][0] < 5 * ureg.km
-            else altitude_5km_indices[-1]
-        )
-        fuel_burn_5km = result["fuel_burn"][altitude_5km_index]
-        ax.annotate(
-            "",
-            xy=(result["t"][altitude_5km_index], fuel_burn_5km),
-            xytext=(result["t"][altitude_5km_index], result["fuel_burn"][0]),
-            arrowprops=dict(arrowstyle="<->", color="b", lw=1.5),
-        )
-        ax.text(
-            result["t"][altitude_5km_index],
-            (result["fuel_burn"][0] + fuel_burn_5km) / 2,
-            f"Fuel Burn to 5 km Altitude: {np.round(fuel_burn_5km.to(ureg.kg), 1):~}",
-            horizontalalignment="center",
-            verticalalignment="center",
-            bbox=dict(facecolor="lightblue", alpha=0.5),
-        )
-    plt.legend()
-    plt.show()
-
 
-def plot_gamma_vs_time(result, phase):
+def plot_gamma_vs_time(result, phase, *, ctx=None, ax=None, show=True, save_path=None):
     """
     Plots the flight path angle (gamma) or descent angle versus time for a given flight phase.
     Parameters:
@@ -666,6 +985,17 @@ def plot_gamma_vs_time(result, phase):
     phase : str
         The flight phase, either "climb" or "descent". Determines the sign of the
         flight path angle and the labels for the plot.
+    ax : matplotlib.axes.Axes, optional
+        Axes to draw on. By default the plot gets a new figure of its own.
+    show : bool, optional
+        Whether to show the new figure, True by default. Axes passed in through `ax`
+        belong to the caller's figure and are never shown or saved here.
+    save_path : str or path-like, optional
+        File to save the new figure to at 100 dpi instead of showing it. The figure is
+        closed afterwards.
+    ctx : PlotContext, optional
+        Magnitudes and altitude crossings of `result`, see `make_context`. Built here
+        if not given.
     Behavior:
     ---------
     - The function generates a plot of the flight path angle (or descent angle) versus time.
@@ -680,80 +1010,78 @@ def plot_gamma_vs_time(result, phase):
     - The function uses `matplotlib` for plotting and requires `ureg` for unit handling.
     Returns:
     --------
-    None
-        Displays the plot directly.
+    matplotlib.axes.Axes
+        The axes the plot is drawn on.
     """
-
-    fig, ax = plt.subplots(figsize=(10, 5))
-    gamma = (
-        -np.degrees(result["gamma"])
-        if phase == "descent"
-        else np.degrees(result["gamma"])
-    )
+    _ensure_mpl()
+    if ctx is None:
+        ctx = make_context(result, phase)
+    t_min = ctx.t_min
+    # the descent angle is plotted positive
+    gamma = -ctx.gamma_deg if phase == "descent" else ctx.gamma_deg
+
+    ax, show, save_path = _axes(ax, show, save_path)
     ax.plot(
-        result["t"],
+        t_min,
         gamma,
         label="Descent Angle" if phase == "descent" else "Flight Path Angle",
     )
     ax.set_title(
         "Descent Angle vs Time" if phase == "descent" else "Flight Path Angle vs Time"
     )
-    ax.xaxis.set_units(ureg.min)
-    ax.yaxis.set_units(ureg.deg)
+    ax.set_xlabel("Time [min]")
+    ax.set_ylabel(
+        "Descent angle [deg]" if phase == "descent" else "Flight path angle [deg]"
+    )
 
     # Add major and minor gridlines
-    ax.grid(which="major", color="k", linestyle="-.", linewidth=0.5)
-    ax.grid(which="minor", color="gray", linestyle=":", linewidth=0.4)
-    ax.minorticks_on()
+    _common_grid(ax)
 
     # Add annotation for flight path angle at 5 km, and at 10 km
-    altitude_5km_indices = np.where(result["h"] >= 5 * ureg.km)[0]
-    if len(altitude_5km_indices) > 0:
-        altitude_5km_index = (
-            altitude_5km_indices[0] if phase == "climb" else altitude_5km_indices[-1]
-        )
+    altitude_5km_index = ctx.idx_5km
+    if altitude_5km_index is not None:
         gamma_5km = gamma[altitude_5km_index]
         if phase == "descent":
             xytext_offset = (
-                result["t"][altitude_5km_index].to(ureg.min) - 0.5 * ureg.min,
-                gamma_5km + 0.5 * ureg.deg,
+                t_min[altitude_5km_index] - _MIN_HALF,
+                gamma_5km + _DEG_HALF,
             )
         else:  # climb
             xytext_offset = (
-                result["t"][altitude_5km_index].to(ureg.min) - 0.5 * ureg.min,
-                gamma_5km - 0.5 * ureg.deg,
+                t_min[altitude_5km_index] - _MIN_HALF,
+                gamma_5km - _DEG_HALF,
             )
         ax.annotate(
-            f"@ 5 km: {np.round(gamma_5km, 1)}°",
-            xy=(result["t"][altitude_5km_index].to(ureg.min), gamma_5km),
+            f"@ 5 km: {gamma_5km:.1f}°",
+            xy=(t_min[altitude_5km_index], gamma_5km),
             xytext=xytext_offset,
             arrowprops=dict(facecolor="blue", arrowstyle="->"),
             bbox=dict(facecolor="lightblue", alpha=0.5),
         )
-    altitude_10km_index = np.where(result["h"] >= 10 * ureg.km)[0][0]
-    gamma_10km = gamma[altitude_10km_index]
-    if phase == "descent":
-        xytext_offset = (
-            result["t"][altitude_10km_index].to(ureg.min) - 0.5 * ureg.min,
-            gamma_10km + 0.5 * ureg.deg,
-        )
-    else:  # climb
-        xytext_offset = (
-            result["t"][altitude_10km_index].to(ureg.min) - 0.5 * ureg.min,
-            gamma_10km - 0.5 * ureg.deg,
+    altitude_10km_index = ctx.idx_10km
+    if altitude_10km_index is not None:
+        gamma_10km = gamma[altitude_10km_index]
+        if phase == "descent":
+            xytext_offset = (
+                t_min[altitude_10km_index] - _MIN_HALF,
+                gamma_10km + _DEG_HALF,
+            )
+        else:  # climb
+            xytext_offset = (
+                t_min[altitude_10km_index] - _MIN_HALF,
+                gamma_10km - _DEG_HALF,
+            )
+        ax.annotate(
+            f"@ 10 km: {gamma_10km:.1f}°",
+            xy=(t_min[altitude_10km_index], gamma_10km),
+            xytext=xytext_offset,
+            arrowprops=dict(facecolor="green", arrowstyle="->"),
+            bbox=dict(facecolor="lightgreen", alpha=0.5),
         )
-    ax.annotate(
-        f"@ 10 km: {np.round(gamma_10km, 1)}°",
-        xy=(result["t"][altitude_10km_index].to(ureg.min), gamma_10km),
-        xytext=xytext_offset,
-        arrowprops=dict(facecolor="green", arrowstyle="->"),
-        bbox=dict(facecolor="lightgreen", alpha=0.5),
-    )
-    plt.legend()
-    plt.show()
+    return _finish(ax, show, save_path)
 
 
-def plot_aoa_vs_time(result):
+def plot_aoa_vs_time(result, *, ctx=None, ax=None, show=True, save_path=None):
     """
     Plots the angle of attack (AoA) versus time from the simulation results for approach phase of the descent.
 
@@ -768,6 +1096,17 @@ def plot_aoa_vs_time(result):
         - "t": Time values (assumed to be in units compatible with `ureg.min`).
         - "aoa": Angle of attack values (assumed to be in units compatible with `ureg.deg`).
         - "h": Altitude values (assumed to be in units compatible with `ureg.km` and `ureg.ft`).
+    ax : matplotlib.axes.Axes, optional
+        Axes to draw on. By default the plot gets a new figure of its own.
+    show : bool, optional
+        Whether to show the new figure, True by default. Axes passed in through `ax`
+        belong to the caller's figure and are never shown or saved here.
+    save_path : str or path-like, optional
+        File to save the new figure to at 100 dpi instead of showing it. The figure is
+        closed afterwards.
+    ctx : PlotContext, optional
+        Magnitudes and altitude crossings of `result`, see `make_context`. Built here
+        if not given.
 
     Notes:
     ------
@@ -790,42 +1129,43 @@ def plot_aoa_vs_time(result):
 
     Returns:
     --------
-    None
+    matplotlib.axes.Axes
+        The axes the plot is drawn on.
     """
-    fig, ax = plt.subplots(figsize=(10, 5))
-    ax.plot(result["t"], result["aoa"], label="Angle of Attack")
-    ax.set_title("AoA (Angle of Attack) vs Time")
-    ax.xaxis.set_units(ureg.min)
-    ax.yaxis.set_units(ureg.deg)
-
-    # Add major and minor gridlines
-    ax.grid(which="major", color="k", linestyle="-.", linewidth=0.5)
-    ax.grid(which="minor", color="gray", linestyle=":", linewidth=0.4)
-    ax.minorticks_on()
-
-    # Add annotation for start of simulation phase
-    ax.annotate(
-        f"AoA: {np.round(result['aoa'][0].to(ureg.deg).m, 1)}°\n@ Alt: {np.round(result['h'][0].to(ureg.km), 1):~}",
-        xy=(result["t"][0], result["aoa"][0]),
-        xytext=(result["t"][0], result["aoa"][0] - 0.5 * ureg.deg),
-        arrowprops=dict(facecolor="green", arrowstyle="->"),
-        bbox=dict(facecolor="lightgreen", alpha=0.5, edgecolor="green"),
+    _ensure_mpl()
+    if ctx is None:
+        ctx = make_context(result)
+    t_min = ctx.t_min
+    # plain magnitudes in the axis units, converted once
+    aoa_deg = result["aoa"].to(_DEG).magnitude
+
+    ax, show, save_path = _axes(ax, show, save_path)
+    _prepare_time_axis(
+        ax,
+        t_min,
+        aoa_deg,
+        "Angle of Attack",
+        "AoA (Angle of Attack) vs Time",
+        "AoA [deg]",
     )
 
-    # Add annotation for end of approach phase
-    ax.annotate(
-        f"AoA: {np.round(result['aoa'][-1].to(ureg.deg).m, 1)}°\n@ Alt: {np.round(result['h'][-1].to(ureg.ft), 1):~}",
-        xy=(result["t"][-1], result["aoa"][-1]),
-        xytext=(result["t"][-1] - 0.5 * ureg.min, result["aoa"][-1] + 0.5 * ureg.deg),
-        arrowprops=dict(facecolor="red", arrowstyle="->"),
-        bbox=dict(facecolor="lightcoral", alpha=0.5, edgecolor="red"),
+    # Add annotations for start of simulation phase and end of approach phase
+    _annotate_endpoints(
+        ax,
+        t_min,
+        aoa_deg,
+        (
+            f"AoA: {np.round(aoa_deg[0], 1)}°\n@ Alt: {_fmt(np.round(ctx.h_km[0], 1), 'km')}",
+            f"AoA: {np.round(aoa_deg[-1], 1)}°\n@ Alt: {_fmt(np.round(ctx.h_km[-1] * _FT_PER_KM, 1), 'ft')}",
+        ),
+        ((0.0, -_DEG_HALF), (-_MIN_HALF, _DEG_HALF)),
+        ("green", "red"),
     )
 
-    plt.legend()
-    plt.show()
+    return _finish(ax, show, save_path)
 
 
-def plot_pitch_angle_vs_time(result):
+def plot_pitch_angle_vs_time(result, *, ctx=None, ax=None, show=True, save_path=None):
     """
     Plots the pitch angle (in degrees) versus time (in minutes) from the given simulation results for approach phase of the descent.
 
@@ -842,6 +1182,17 @@ def plot_pitch_angle_vs_time(result):
             Pitch angle values (assumed to be in units compatible with `ureg.rad`).
         - "h" : array-like
             Altitude values (assumed to be in units compatible with `ureg.km` or `ureg.ft`).
+    ax : matplotlib.axes.Axes, optional
+        Axes to draw on. By default the plot gets a new figure of its own.
+    show : bool, optional
+        Whether to show the new figure, True by default. Axes passed in through `ax`
+        belong to the caller's figure and are never shown or saved here.
+    save_path : str or path-like, optional
+        File to save the new figure to at 100 dpi instead of showing it. The figure is
+        closed afterwards.
+    ctx : PlotContext, optional
+        Magnitudes and altitude crossings of `result`, see `make_context`. Built here
+        if not given.
 
     Annotations:
     ------------
@@ -855,8 +1206,8 @@ def plot_pitch_angle_vs_time(result):
 
     Returns:
     --------
-    None
-        Displays the plot.
+    matplotlib.axes.Axes
+        The axes the plot is drawn on.
 
     Notes:
     ------
@@ -865,45 +1216,34 @@ def plot_pitch_angle_vs_time(result):
     - The `ureg` object and `np` (NumPy) must be imported and properly configured in the
       script where this function is used.
     """
-    fig, ax = plt.subplots(figsize=(10, 5))
-    ax.plot(result["t"], np.degrees(result["theta"]), label="Pitch Angle")
-    ax.set_title("Pitch Angle vs Time")
-    ax.xaxis.set_units(ureg.min)
-    ax.yaxis.set_units(ureg.deg)
-
-    # Add major and minor gridlines
-    ax.grid(which="major", color="k", linestyle="-.", linewidth=0.5)
-    ax.grid(which="minor", color="gray", linestyle=":", linewidth=0.4)
-    ax.minorticks_on()
-
-    # Add annotation for pitch angle at the start of approach phase
-    ax.annotate(
-        f"Pitch: {np.round(result['theta'][0].to('deg').m, 1)}°\n@ Alt: {np.round(result['h'][0].to(ureg.km), 1):~}",
-        xy=(result["t"][0], np.degrees(result["theta"][0])),
-        xytext=(
-            result["t"][0] + 0.5 * ureg.min,
-            np.degrees(result["theta"][0]) - 1 * ureg.deg,
-        ),
-        arrowprops=dict(facecolor="blue", arrowstyle="->"),
-        bbox=dict(facecolor="lightblue", alpha=0.5, edgecolor="blue"),
+    _ensure_mpl()
+    if ctx is None:
+        ctx = make_context(result)
+    t_min = ctx.t_min
+    # plain magnitudes in the axis units, converted once
+    theta_deg = result["theta"].to(_DEG).magnitude
+
+    ax, show, save_path = _axes(ax, show, save_path)
+    _prepare_time_axis(
+        ax, t_min, theta_deg, "Pitch Angle", "Pitch Angle vs Time", "Pitch angle [deg]"
     )
 
-    # Add annotation for pitch angle at the end of approach phase
-    ax.annotate(
-        f"Pitch: {np.round(result['theta'][-1].to('deg').m, 1)}°\n@ Alt: {np.round(result['h'][-1].to(ureg.ft), 1):~}",
-        xy=(result["t"][-1], np.degrees(result["theta"][-1])),
-        xytext=(
-            result["t"][-1] - 1 * ureg.min,
-            np.degrees(result["theta"][-1]) + 1 * ureg.deg,
+    # Add annotations for pitch angle at the start and end of approach phase
+    _annotate_endpoints(
+        ax,
+        t_min,
+        theta_deg,
+        (
+            f"Pitch: {np.round(theta_deg[0], 1)}°\n@ Alt: {_fmt(np.round(ctx.h_km[0], 1), 'km')}",
+            f"Pitch: {np.round(theta_deg[-1], 1)}°\n@ Alt: {_fmt(np.round(ctx.h_km[-1] * _FT_PER_KM, 1), 'ft')}",
         ),
-        arrowprops=dict(facecolor="red", arrowstyle="->"),
-        bbox=dict(facecolor="lightcoral", alpha=0.5, edgecolor="red"),
+        ((_MIN_HALF, -_DEG_ONE), (-_MIN_ONE, _DEG_ONE)),
+        ("blue", "red"),
     )
-    plt.legend()
-    plt.show()
+    return _finish(ax, show, save_path)
 
 
-def plot_thrust_vs_time(result):
+def plot_thrust_vs_time(result, *, ctx=None, ax=None, show=True, save_path=None):
     """
     Plots thrust versus time and annotates the start and end of the approach phase of the descent.
 
@@ -917,6 +1257,17 @@ def plot_thrust_vs_time(result):
             Thrust data (assumed to be in units compatible with `ureg.N`).
         - "h" : array-like
             Altitude data (assumed to be in units compatible with `ureg.km` or `ureg.ft`).
+    ax : matplotlib.axes.Axes, optional
+        Axes to draw on. By default the plot gets a new figure of its own.
+    show : bool, optional
+        Whether to show the new figure, True by default. Axes passed in through `ax`
+        belong to the caller's figure and are never shown or saved here.
+    save_path : str or path-like, optional
+        File to save the new figure to at 100 dpi instead of showing it. The figure is
+        closed afterwards.
+    ctx : PlotContext, optional
+        Magnitudes and altitude crossings of `result`, see `make_context`. Built here
+        if not given.
 
     Features:
     ---------
@@ -938,46 +1289,41 @@ def plot_thrust_vs_time(result):
     - Requires `matplotlib.pyplot` as `plt`.
     - Requires `numpy` as `np`.
     - Requires a unit registry object `ureg` for handling units.
-    """
-    fig, ax = plt.subplots(figsize=(10, 5))
-    ax.plot(result["t"], result["thrust"], label="Thrust")
-    ax.set_title("Thrust vs Time")
-    ax.xaxis.set_units(ureg.min)
-    ax.yaxis.set_units(ureg.N)
-
-    # Add major and minor gridlines
-    ax.grid(which="major", color="k", linestyle="-.", linewidth=0.5)
-    ax.grid(which="minor", color="gray", linestyle=":", linewidth=0.4)
-    ax.minorticks_on()
-
-    # Add annotation for start of approach phase
-    ax.annotate(
-        f"Start of Approach\nThrust: {np.round(result['thrust'][0].to(ureg.kN), 1):~}\n@ Alt: {np.round(result['h'][0].to(ureg.km), 1):~}",
-        xy=(result["t"][0], result["thrust"][0]),
-        xytext=(
-            result["t"][0],
-            result["thrust"][0] - 0.05 * result["thrust"][0],
-        ),
-        arrowprops=dict(facecolor="blue", arrowstyle="->"),
-        bbox=dict(facecolor="lightblue", alpha=0.5, edgecolor="blue"),
-    )
 
-    # Add annotation for end of approach phase
-    ax.annotate(
-        f"End of Approach\nThrust: {np.round(result['thrust'][-1].to(ureg.kN), 1):~}\n@ Alt: {np.round(result['h'][-1].to(ureg.ft), 1):~}",
-        xy=(result["t"][-1], result["thrust"][-1]),
-        xytext=(
-            result["t"][-1] - 1 * ureg.min,  # Move left by 1 minute
-            result["thrust"][-1] + 0.05 * result["thrust"][-1],
+    Returns:
+    --------
+    matplotlib.axes.Axes
+        The axes the plot is drawn on.
+    """
+    _ensure_mpl()
+    if ctx is None:
+        ctx = make_context(result)
+    t_min = ctx.t_min
+    # plain magnitudes in the axis units, converted once
+    thrust_n = result["thrust"].to(_NEWTON).magnitude
+
+    ax, show, save_path = _axes(ax, show, save_path)
+    _prepare_time_axis(ax, t_min, thrust_n, "Thrust", "Thrust vs Time", "Thrust [N]")
+
+    # Add annotations for start and end of approach phase, 5% of the thrust away
+    _annotate_endpoints(
+        ax,
+        t_min,
+        thrust_n,
+        (
+            f"Start of Approach\nThrust: {_fmt(np.round(thrust_n[0] * _KN_PER_N, 1), 'kN')}\n@ Alt: {_fmt(np.round(ctx.h_km[0], 1), 'km')}",
+            f"End of Approach\nThrust: {_fmt(np.round(thrust_n[-1] * _KN_PER_N, 1), 'kN')}\n@ Alt: {_fmt(np.round(ctx.h_km[-1] * _FT_PER_KM, 1), 'ft')}",
         ),
-        arrowprops=dict(facecolor="red", arrowstyle="->"),
-        bbox=dict(facecolor="lightcoral", alpha=0.5, edgecolor="red"),
+        # Move the end annotation left by 1 minute
+        ((0.0, -0.05 * thrust_n[0]), (-_MIN_ONE, 0.05 * thrust_n[-1])),
+        ("blue", "red"),
     )
-    plt.legend()
-    plt.show()
+    return _finish(ax, show, save_path)
 
 
-def plot_ias_vs_altitude(result, phase):
+def plot_ias_vs_altitude(
+    result, phase, *, ctx=None, ax=None, show=True, save_path=None
+):
     """
     Plots Indicated Airspeed (IAS) versus Altitude for a given flight phase.
 
@@ -988,9 +1334,18 @@ def plot_ias_vs_altitude(result, phase):
                        - "v_ias": Indicated Airspeed data (array-like).
         phase (str): The flight phase, either "climb", "descent", or "descent_approach"
                      If the phase is "climb" or "descent", the IAS values are rounded.
+        ax (matplotlib.axes.Axes, optional): Axes to draw on. By default the plot gets
+            a new figure of its own.
+        show (bool, optional): Whether to show the new figure, True by default. Axes
+            passed in through `ax` belong to the caller's figure and are never shown or
+            saved here.
+        save_path (str or path-like, optional): File to save the new figure to at 100 dpi
+            instead of showing it. The figure is closed afterwards.
+        ctx (PlotContext, optional): Magnitudes and altitude crossings of `result`, see
+            `make_context`. Built here if not given.
 
     Returns:
-        None: Displays a plot of IAS vs Altitude.
+        matplotlib.axes.Axes: The axes the plot is drawn on.
 
     Notes:
         - The x-axis represents altitude and uses units of kilometers (km).
@@ -1001,19 +1356,120 @@ def plot_ias_vs_altitude(result, phase):
     Example:
         plot_ias_vs_altitude(result={"h": [0, 1, 2], "v_ias": [100, 150, 200]}, phase="climb")
     """
-    fig, ax = plt.subplots(figsize=(10, 5))
-    ias = (
-        np.round(result["v_ias"]) if phase in ["climb", "descent"] else result["v_ias"]
-    )
-    ax.plot(result["h"], ias, label="Indicated Airspeed")
+    _ensure_mpl()
+    if ctx is None:
+        ctx = make_context(result, phase)
+    ax, show, save_path = _axes(ax, show, save_path)
+    # plain magnitudes in the axis units, converted once
+    ias = result["v_ias"].to(_MPS).magnitude
+    if phase in ["climb", "descent"]:
+        ias = np.round(ias)
+    ax.plot(ctx.h_km, ias, label="Indicated Airspeed")
     ax.set_title("IAS (Indicated Airspeed) vs Altitude")
-    ax.xaxis.set_units(ureg.km)
-    ax.yaxis.set_units(ureg.m / ureg.s)
+    ax.set_xlabel("Altitude [km]")
+    ax.set_ylabel("IAS [m/s]")
 
     # Add major and minor gridlines
-    ax.grid(which="major", color="k", linestyle="-.", linewidth=0.5)
-    ax.grid(which="minor", color="gray", linestyle=":", linewidth=0.4)
-    ax.minorticks_on()
+    _common_grid(ax)
+
+    return _finish(ax, show, save_path)
+
+
+def plot_approach_controls(result, *, ctx=None, show=True, save_path=None):
+    """
+    Draws the AoA, pitch angle and thrust of the approach phase of the descent over time,
+    stacked on the axes of a single figure instead of building one figure per plot.
+
+    Parameters:
+    -----------
+    result : dict
+        Simulation results of the "descent_approach" phase, see `plot_aoa_vs_time`,
+        `plot_pitch_angle_vs_time` and `plot_thrust_vs_time`.
+    ctx : PlotContext, optional
+        Magnitudes and altitude crossings of `result`, see `make_context`. Built here
+        if not given.
+    show : bool, optional
+        Whether to show the figure, True by default.
+    save_path : str or path-like, optional
+        File to save the figure to at 100 dpi instead of showing it. The figure is
+        closed afterwards.
+
+    Returns:
+    --------
+    matplotlib.figure.Figure
+        The figure of the three plots.
+    """
+    _ensure_mpl()
+    if ctx is None:
+        ctx = make_context(result)
+    fig, axes = plt.subplots(3, 1, figsize=(10, 15), constrained_layout=True)
+    for plot, ax in zip(
+        (plot_aoa_vs_time, plot_pitch_angle_vs_time, plot_thrust_vs_time), axes
+    ):
+        plot(result, ctx=ctx, ax=ax)
+
+    _show_or_save(fig, show, save_path)
+    return fig
 
-    plt.legend()
-    plt.show()
+
+def plot_report(result, phase, *, show=True, save_path=None):
+    """
+    Draws all plots of one flight phase on the axes of a single figure, in the order of
+    the simulation notebook, instead of building one figure per plot.
+
+    Parameters:
+    -----------
+    result : dict
+        Simulation results as returned by `load_or_run_simulation`.
+    phase : str
+        The flight phase of the results, "climb", "descent" or "descent_approach".
+    show : bool, optional
+        Whether to show the figure, True by default.
+    save_path : str or path-like, optional
+        File to save the figure to at 100 dpi instead of showing it. The figure is
+        closed afterwards.
+
+    Returns:
+    --------
+    matplotlib.figure.Figure
+        The report figure.
+    """
+    _ensure_mpl()
+    if phase == "descent_approach":
+        plots = [
+            plot_horizontal_distance_vs_time,
+            plot_altitude_vs_time,
+            plot_altitude_vs_distance,
+            partial(plot_altitude_vs_tas, phase=phase),
+            plot_fuel_burn_vs_time,
+            plot_aoa_vs_time,
+            plot_pitch_angle_vs_time,
+            plot_thrust_vs_time,
+            partial(plot_ias_vs_altitude, phase=phase),
+        ]
+    else:
+        plots = [
+            plot_horizontal_distance_vs_time,
+            plot_altitude_vs_time,
+            plot_altitude_vs_distance,
+            partial(plot_altitude_vs_tas, phase=phase),
+            plot_mach_vs_time,
+            partial(plot_tas_vs_time, phase=phase),
+            plot_fuel_burn_vs_time,
+            partial(plot_gamma_vs_time, phase=phase),
+            partial(plot_ias_vs_altitude, phase=phase),
+        ]
+
+    # convert the result once for all plots
+    ctx = make_context(result, phase)
+    n_rows = -(-len(plots) // 2)
+    fig, axes = plt.subplots(n_rows, 2, figsize=(20, 5 * n_rows))
+    for plot, ax in zip(plots, axes.flat):
+        plot(result, ctx=ctx, ax=ax)
+    # drop the unused axes of an odd number of plots
+    for ax in axes.flat[len(plots) :]:
+        ax.remove()
+    fig.tight_layout()
+
+    _show_or_save(fig, show, save_path)
+    return fig
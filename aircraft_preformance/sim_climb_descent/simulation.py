@@ -1,64 +1,220 @@
+import math
 import os
 import json
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
 
 from . import ureg
-from ..helpers.airspeed import cas2tas, cas2mach, tas2cas, tas2mach
-from ..helpers.aerodynamics import c_l_steady
-from .thrust_model import max_thrust_model, fuel_flow
-from .pilot_control import pilot_pitch_control
-from .eom import inst_dgamma_dt, inst_dv_dt
-from .const import Grav_const, Max_Thrust_SE_SL, BPR, S
-from .aerodynamic_char import aoa_steady_staight, drag, gamma_steady_straight
-from ambiance import Atmosphere
+from .pilot_control import _gain_si, pilot_pitch_control
+from .integrator import (
+    _euler_step_si,
+    _euler_trim_si,
+    _reached_end_si,
+    _thrust_scale_si,
+    integrate_approach_si,
+    integrate_climb_si,
+)
+
+# units attached to the results, resolved once at import
+_UNITS = {
+    "t": ureg.s,
+    "x": ureg.m,
+    "h": ureg.m,
+    "v_tas": ureg.m / ureg.s,
+    "v_ias": ureg.m / ureg.s,
+    "mach": ureg.dimensionless,
+    "gamma": ureg.rad,
+    "fuel_burn": ureg.kg,
+    "aoa": ureg.rad,
+    "theta": ureg.rad,
+    "thrust": ureg.N,
+}
+
+
+# keys of the histories returned by the integrators, in their order
+_EULER_KEYS = (
+    "t",
+    "x",
+    "h",
+    "v_tas",
+    "v_ias",
+    "mach",
+    "gamma",
+    "fuel_burn",
+    "aoa",
+    "theta",
+)
+_APPROACH_KEYS = (
+    "t",
+    "x",
+    "h",
+    "v_ias",
+    "mach",
+    "fuel_burn",
+    "aoa",
+    "theta",
+    "thrust",
+)
+
+# default upper bound of the simulated climb or descent time, sizes the result arrays
+_T_MAX = ureg("3 h")
+
+# directory of the simulation results files
+_RESULTS_DIR = "simulation_results"
+
+# key of the (result name, unit) string array stored next to the magnitudes in a
+# results archive
+_UNITS_KEY = "_units"
+
+
+def _to_quantities(res):
+    """
+    Attach the units of `_UNITS` to the SI float histories of `res`, one array each.
+    """
+
+    return {key: np.asarray(values) * _UNITS[key] for key, values in res.items()}
+
+
+def _pitch_control_si(
+    pilot_control_model, k_p, theta_trim, v_ref, cruise_mach, phase_is_climb
+):
+    """
+    Pitch attitude [rad] of the pilot control model as a function of IAS [m/s] and
+    altitude [m], calling the model with pint Quantities.
+    """
+
+    theta_trim_q = theta_trim * _UNITS["theta"]
+    return lambda v_ias, h: (
+        pilot_control_model(
+            k_p,
+            theta_trim_q,
+            v_ref,
+            v_ias * _UNITS["v_ias"],
+            h * _UNITS["h"],
+            cruise_mach,
+            phase_is_climb,
+        )
+        .to("rad")
+        .magnitude
+    )
+
+
+def _results_file_base(w_initial, v_ref, phase):
+    """
+    Path of the results files of a simulation, without the file extension.
+    """
+
+    return os.path.join(
+        _RESULTS_DIR,
+        f"{phase}_{int(np.round(w_initial.to('N').m))}_{int(np.round(v_ref.to('m/s').m))}_simulation_result",
+    )
 
 
 def serialize_and_write_results_file(res, w_initial, v_ref, phase):
     """
-    Serializes simulation results and writes them to a JSON file.
+    Serializes simulation results and writes them to a compressed NumPy archive.
 
-    This function takes a dictionary of simulation results, converts the values
-    (assumed to be quantities with units) into a serializable format, and writes
-    the results to a JSON file. Each result is stored with its magnitude and units.
+    This function takes a dictionary of simulation results, assumed to be quantities
+    with units, and writes the magnitude arrays to an `.npz` archive, one array per
+    result. The units of the results are stored in the same archive, as an array of
+    (result name, unit) strings under the `_units` key. The archive is written to a
+    temporary file first and then moved into place, so a results file is always complete.
 
     Args:
         res (dict): A dictionary where keys are result names and values are
-                    quantities (e.g., Pint Quantity objects) to be serialized.
+                    Quantity arrays (one Pint Quantity per history) to be serialized.
+                    Lists of Quantities are accepted as well and converted first.
         phase (str): A string representing the phase of the simulation
                      (e.g., "climb" or "descent"). This is used to name the
-                     output JSON file.
+                     output archive.
 
     Raises:
         ValueError: If the input data cannot be serialized properly.
         IOError: If there is an issue writing to the output file.
 
     Output:
-        A JSON file named `<phase>_simulation_result.json` containing the
-        serialized results.
+        An archive named `<phase>_<w>_<v_ref>_simulation_result.npz` containing the
+        magnitudes and the units of the results.
     """
-    dump_res = {}
-    for i in res:
-        res[i] = ureg.Quantity.from_list(res[i])
-        dump_res[i] = {}
-        dump_res[i]["magnitude"] = json.dumps(res[i].magnitude.tolist())
-        dump_res[i]["units"] = str(res[i].units)
-
-    directory = "simulation_results"
-    file_path = os.path.join(
-        directory,
-        f"{phase}_{int(np.round(w_initial.to('N').m))}_{int(np.round(v_ref.to('m/s').m))}_simulation_result.json",
+    # the results are Quantity arrays, their magnitudes are written in binary as is.
+    # Only lists of Quantities are rebuilt into a Quantity array first.
+    res = {
+        i: (
+            values
+            if isinstance(values, ureg.Quantity)
+            else ureg.Quantity.from_list(values)
+        )
+        for i, values in res.items()
+    }
+    magnitudes = {i: res[i].magnitude for i in res}
+    magnitudes[_UNITS_KEY] = np.array([(i, str(res[i].units)) for i in res])
+
+    file_base = _results_file_base(w_initial, v_ref, phase)
+    # create directory if it doesn't exist, also when simulations running in parallel
+    # create it at the same time
+    os.makedirs(_RESULTS_DIR, exist_ok=True)
+
+    # create the result archive under a temporary name of this process, and replace
+    # the results file with it once it is complete
+    tmp_path = f"{file_base}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as file:
+        np.savez_compressed(file, **magnitudes)
+    os.replace(tmp_path, file_base + ".npz")
+
+
+def _simulation_euler_py(
+    t_end, dt, state0, pilot_control_model, k_p, v_ref, cruise_mach, phase
+):
+    """
+    Step loop of `simulation_euler` in plain Python for pilot control models other
+    than `pilot_pitch_control`, which cannot be called from compiled code.
+    Runs the trim and Euler step cores of `integrator.integrate_climb_si` from the
+    state `(x, h, w, v_ias)` in SI floats and returns the same row buffer as
+    `integrate_climb_si`, one row per time step in the column order of `_EULER_KEYS`.
+    """
+
+    x, h, w, v_ias = state0
+    m_f_burnt = 0.0
+    phase_is_climb = phase == "climb"
+    thrust_scale = _thrust_scale_si(phase_is_climb)
+
+    # trimmed initial condition, IAS is assumed same as CAS
+    atm, v_tas, mach, aoa, gamma = _euler_trim_si(h, w, v_ias, thrust_scale)
+    theta_trim = aoa + gamma
+    pitch_control = _pitch_control_si(
+        pilot_control_model, k_p, theta_trim, v_ref, cruise_mach, phase_is_climb
     )
-    # create directory if it doesn't exist
-    if not os.path.exists(directory):
-        os.makedirs(directory)
 
-    # create a JSON result file
-    with open(file_path, "w") as file:
-        json.dump(dump_res, file, indent=4)
+    # preallocate one result row per time step for the longest simulated time, with
+    # the columns in the order of `_EULER_KEYS`, and initialize it at t = 0
+    n_max = int(math.ceil(t_end / dt))
+    res = np.empty((n_max + 1, len(_EULER_KEYS)))
+    res[0] = (0.0, x, h, v_tas, v_ias, mach, gamma, m_f_burnt, aoa, theta_trim)
+
+    n = 0
+    while n < n_max:
+        # re-evaluate control model at start of dt, the step itself is shared with
+        # the compiled loop
+        theta = pitch_control(v_ias, h)
+        x, h, w, v_tas, v_ias, mach, gamma, m_f_burnt, aoa, atm = _euler_step_si(
+            dt, thrust_scale, theta, x, h, w, v_tas, mach, gamma, m_f_burnt, atm
+        )
+
+        # store the results
+        n += 1
+        res[n] = (n * dt, x, h, v_tas, v_ias, mach, gamma, m_f_burnt, aoa, theta)
+
+        if _reached_end_si(h, phase_is_climb):
+            break
+
+    # trim to the simulated time steps
+    return res[: n + 1]
 
 
 def simulation_euler(
-    ics, time_step, pilot_control_model, k_p, v_ref, cruise_mach, phase
+    ics, time_step, pilot_control_model, k_p, v_ref, cruise_mach, phase, t_end=_T_MAX
 ):
     """
     Simulates the climb or descent phase of an aircraft using the Euler method.
@@ -70,15 +226,18 @@ def simulation_euler(
             - "w" (float): Initial weight of the aircraft.
             - "v_ias" (float): Initial indicated airspeed (IAS).
         time_step (pint.Quantity): Time step for the simulation (e.g., in seconds).
-        pilot_control_model (callable): Function to compute the pitch attitude based on control inputs.
-        k_p (float): Proportional gain for the pilot control model.
+        pilot_control_model (callable): Function to compute the pitch attitude based on control inputs,
+            called as `pilot_control_model(k_p, theta_trim, v_ref, v_ias, h, cruise_mach, phase_is_climb)`.
+        k_p (pint.Quantity): Proportional gain for the pilot control model, in rad*s/m.
         v_ref_ias (float): Reference indicated airspeed (IAS) for the control model.
         cruise_mach (float): Cruise Mach number for the simulation.
         phase (str): Phase of flight, either "climb" or "descent".
         take_off_weight (float): Initial take-off weight of the aircraft.
+        t_end (pint.Quantity, optional): Upper bound of the simulated time. Defaults to 3 hours.
 
     Returns:
-        dict: A dictionary containing the simulation results with the following keys:
+        dict: A dictionary containing the simulation results as pint Quantity arrays
+            in SI units, with the following keys:
             - "t": List of time steps.
             - "x": List of horizontal positions.
             - "h": List of altitudes.
@@ -91,120 +250,57 @@ def simulation_euler(
             - "theta": List of pitch attitudes.
 
     Notes:
+        - The time steps are integrated in plain SI floats, units are attached to the
+          result histories once at the end.
         - The simulation stops when the aircraft reaches a cruise altitude of 10,000 m during climb
-          or descends to 1,000 m during descent.
-        - Results are serialized and saved to a JSON file named `<phase>_simulation_result.json`.
+          or descends to 1,000 m during descent. If it does not get there within `t_end`, a warning
+          is issued and the truncated results are returned without writing them to the results file.
+        - Results are serialized and saved to an archive named `<phase>_<w>_<v_ref>_simulation_result.npz`,
+          see `serialize_and_write_results_file`.
 
     Raises:
         ValueError: If the `phase` parameter is not "climb" or "descent".
     """
 
-    t = ureg("0 s")
-    dt = time_step
-
-    # initialize state variable
-    x = ics["x"]
-    h = ics["h"]
-    w = ics["w"]
-    m_f_burnt = ureg("0 g")
-    v_ias = ics["v_ias"]
-    v_tas = cas2tas(v_ias, h)  # IAS is assumed same as CAS
-    mach = cas2mach(v_ias, h)
-    aoa = aoa_steady_staight(v_ias, h, w, S)
-    # 95% of max thrust is applied for climb phase and 5% of max thrust is applied for descent phase
-    thrust_app_perc = 0.95 if phase == "climb" else 0.05
-
-    gamma = gamma_steady_straight(
-        # total thrust of 4 engines and apply 95% of it
-        4 * max_thrust_model(Max_Thrust_SE_SL, BPR, h, mach) * thrust_app_perc,
-        drag(v_ias, h, c_l_steady(v_ias, h, w, S), S),
-        w,
+    # integrate in SI floats, units are attached to the results once at the end
+    dt = time_step.to("s").magnitude
+    t_end_s = t_end.to("s").magnitude
+    state0 = (
+        ics["x"].to("m").magnitude,
+        ics["h"].to("m").magnitude,
+        ics["w"].to("N").magnitude,
+        ics["v_ias"].to("m/s").magnitude,
     )
-    theta_trim = aoa + gamma
 
-    # initialize result dictionary at t = 0
-    res = {
-        "t": [t],
-        "x": [x],
-        "h": [h],
-        "v_tas": [v_tas],
-        "v_ias": [v_ias],
-        "mach": [mach],
-        "gamma": [gamma],
-        "fuel_burn": [m_f_burnt],
-        "aoa": [aoa],
-        "theta": [theta_trim],
-    }
-
-    while True:
-        # re-evaluate control model at start of dt
-        # compute pitch attitude in rad
-        theta = pilot_control_model(
-            k_p, theta_trim, v_ref, v_ias, h, cruise_mach, phase
+    if pilot_control_model is pilot_pitch_control:
+        # the built-in control law runs with the whole step loop in compiled code
+        params = (
+            _gain_si(k_p),
+            v_ref.to("m/s").magnitude,
+            cruise_mach,
+            phase == "climb",
         )
-        # compute angle of attack
-        aoa = theta - gamma
-        # compute lift coeff based on angle of attack
-        c_l = 0.03 + (4.4 * aoa)
-
-        # compute forces at start of dt
-        # compute instantaneous lift
-        inst_lift = (
-            (1 / 2)
-            * c_l
-            * (Atmosphere(h.to("m").m).density[0] * ureg("kg/m**3"))
-            * S
-            * v_tas**2
+        rows = integrate_climb_si(t_end_s, dt, state0, params)
+    else:
+        rows = _simulation_euler_py(
+            t_end_s, dt, state0, pilot_control_model, k_p, v_ref, cruise_mach, phase
         )
-        # compute instantaneous total thrust of 4 engines and apply 95% of it
-        inst_thrust = (
-            4 * max_thrust_model(Max_Thrust_SE_SL, BPR, h, mach) * thrust_app_perc
+
+    # both loops fill the same row buffer, one history per column of `_EULER_KEYS`
+    res = dict(zip(_EULER_KEYS, rows.T))
+    reached_end = _reached_end_si(res["h"][-1], phase == "climb")
+    res = _to_quantities(res)
+
+    # a run cut off at t_end is returned for inspection, but not stored as a result
+    if not reached_end:
+        warnings.warn(
+            f"The {phase} did not reach its end altitude within {t_end}, "
+            "the results are truncated and not written to the results file.",
+            stacklevel=2,
         )
+        return res
 
-        # compute instantaneous drag
-        inst_drag = drag(v_ias, h, c_l, S)
-
-        # simulate changes during dt
-        dh = v_tas * np.sin(gamma) * dt
-        dv_tas = inst_dv_dt(inst_thrust, inst_drag, w, gamma) * dt
-        dgamma = inst_dgamma_dt(inst_lift, w, v_tas) * dt
-        dm = -fuel_flow(inst_thrust, mach, h) * dt
-        dw = dm * Grav_const
-        dx = v_tas * np.cos(gamma) * dt
-
-        # reflect changes after dt
-        x += dx
-        h += dh
-        v_tas += dv_tas
-        v_ias = tas2cas(v_tas, h)
-        mach = cas2mach(v_ias, h)
-        gamma += dgamma
-        m_f_burnt += np.abs(dm)
-        w += dw
-        t += dt
-
-        # append the results
-        res["t"].append(t)
-        res["x"].append(x)
-        res["h"].append(h)
-        res["v_tas"].append(v_tas)
-        res["v_ias"].append(v_ias)
-        res["mach"].append(mach)
-        res["gamma"].append(gamma)
-        res["fuel_burn"].append(m_f_burnt)
-        res["aoa"].append(aoa)
-        res["theta"].append(theta)
-
-        # set stop condition i.e. aircraft reaches a cruise altitude of 10,000 m or descends to 1000m
-        match phase:
-            case "climb":
-                if h >= ureg("10000 m"):
-                    break
-            case "descent":
-                if h <= ureg("1000 m"):
-                    break
-
-    # serialize results and prepare for JSON results
+    # serialize results to the results file
     serialize_and_write_results_file(res, ics["w"], v_ref, phase)
     return res
 
@@ -213,69 +309,32 @@ def simulation_descent_approach_euler(
     ics, time_step, v_ref, glideslope_angle, screen_h, phase
 ):
 
-    t = ureg("0 s")
-    dt = time_step
+    # integrate in SI floats with the compiled step loop, units are attached to the
+    # results once at the end
+    dt = time_step.to("s").magnitude
+    state0 = (
+        ics["x"].to("m").magnitude,
+        ics["h"].to("m").magnitude,
+        ics["w"].to("N").magnitude,
+    )
+    params = (
+        v_ref.to("m/s").magnitude,
+        glideslope_angle.to("rad").magnitude,
+        screen_h.to("m").magnitude,
+    )
 
-    # initialize state variable
-    x = ics["x"]
-    h = ics["h"]
-    w = ics["w"]
-    m_f_burnt = ureg("0 g")
-    v_tas = v_ref
-    v_ias = tas2cas(v_tas, h)
-    mach = tas2mach(v_tas, h)
-    gamma = -1 * glideslope_angle.to("rad")
+    # the compiled loop sizes its result arrays from the sink rate down to the screen
+    # height, which needs a descent at a positive speed starting above it
+    if params[0] <= 0 or params[1] <= 0:
+        raise ValueError("Approach speed and glideslope angle must be positive.")
+    if state0[1] <= params[2]:
+        raise ValueError("Initial altitude must be above the screen height.")
 
-    # initialize result dictionary at t = 0
-    res = {
-        "t": [t],
-        "x": [x],
-        "h": [h],
-        "v_ias": [v_ias],
-        "mach": [mach],
-        "fuel_burn": [m_f_burnt],
-        "aoa": [],
-        "theta": [],
-        "thrust": [],
-    }
+    res = _to_quantities(
+        dict(zip(_APPROACH_KEYS, integrate_approach_si(dt, state0, params)))
+    )
 
-    while True:
-        # based on simplified EOM for steady straight powered glide flight compute pitch and thrust setting
-        aoa = aoa_steady_staight(tas2cas(v_tas, h), h, w, S)
-        theta = aoa + gamma
-        res["aoa"].append(aoa)
-        res["theta"].append(theta)
-
-        c_l = c_l_steady(tas2cas(v_tas, h), h, w, S)
-        inst_drag = drag(tas2cas(v_tas, h), h, c_l, S)
-        inst_thrust = inst_drag + (w * np.sin(gamma))
-        res["thrust"].append(inst_thrust)
-
-        # compute changes during time_step dt
-        dh = v_tas * np.sin(gamma) * dt
-        dx = v_tas * np.cos(gamma) * dt
-        dm = -fuel_flow(inst_thrust, mach, h) * dt
-        dw = dm * Grav_const
-
-        # reflect changes
-        h += dh
-        x += dx
-        m_f_burnt += np.abs(dm)
-        w += dw
-        t += dt
-        mach = tas2mach(v_tas, h)
-
-        if h <= screen_h:
-            break
-        else:
-            res["t"].append(t)
-            res["x"].append(x)
-            res["h"].append(h)
-            res["v_ias"].append(tas2cas(v_tas, h))
-            res["mach"].append(mach)
-            res["fuel_burn"].append(m_f_burnt)
-
-    # serialize results and prepare for JSON results
+    # serialize results to the results file
     serialize_and_write_results_file(res, ics["w"], v_ref, phase=phase)
 
     return res
@@ -283,8 +342,10 @@ def simulation_descent_approach_euler(
 
 def load_or_run_simulation(simulation, **kwargs):
     """
-    Loads simulation results from a JSON file if available, or runs a simulation
-    to generate the results if the file is not found.
+    Loads simulation results from a results file if available, or runs a simulation
+    to generate the results if the file is not found. Results are read from the `.npz`
+    archive written by `serialize_and_write_results_file`, or from a JSON results file
+    of earlier versions of this package.
 
     Args:
         ics (dict): Initial conditions for the simulation.
@@ -296,6 +357,7 @@ def load_or_run_simulation(simulation, **kwargs):
         take_off_weight (float): Take-off weight of the aircraft.
         glideslope_angle (Quantity, optional): Glideslope angle for descent approach. Defaults to 3 degrees.
         screen_h (Quantity, optional): Screen height for descent approach. Defaults to 35 feet.
+        t_end (Quantity, optional): Upper bound of the simulated climb or descent time. Defaults to 3 hours.
 
     Returns:
         dict: A dictionary containing the simulation results. If loaded from a file,
@@ -317,16 +379,19 @@ def load_or_run_simulation(simulation, **kwargs):
 
     result = {}
 
-    directory = "simulation_results"
-    file_path = os.path.join(
-        directory,
-        f"{phase}_{int(np.round(ics['w'].to('N').m))}_{int(np.round(v_ref.to('m/s').m))}_simulation_result.json",
-    )
+    file_base = _results_file_base(ics["w"], v_ref, phase)
 
     # Check if the results file exists
-    if os.path.exists(file_path):
+    if os.path.exists(file_base + ".npz"):
+        print("Simulation results file found")
+        with np.load(file_base + ".npz") as magnitudes:
+            for i, unit in magnitudes[_UNITS_KEY]:
+                result[str(i)] = magnitudes[i] * ureg(str(unit))
+        print("Simulation results loaded")
+    elif os.path.exists(file_base + ".json"):
         print("Simulation results file found")
-        with open(file_path, "r") as file:
+        # results file of earlier versions, with the magnitudes as JSON strings
+        with open(file_base + ".json", "r") as file:
             loaded_res = json.load(file)
             for i in loaded_res:
                 result[i] = json.loads(loaded_res[i]["magnitude"]) * ureg(
@@ -340,3 +405,34 @@ def load_or_run_simulation(simulation, **kwargs):
         print("Simulation completed")
 
     return result
+
+
+def load_or_run_simulations(simulation, kwargs_list, max_workers=None):
+    """
+    Loads or runs several independent simulations, e.g. a sweep over initial weights
+    and reference velocities, in parallel worker processes.
+
+    Each entry of `kwargs_list` is handled by `load_or_run_simulation` in a worker
+    process, so runs without a results file are simulated concurrently. The compiled
+    integrators are cached on disk, so the workers load them instead of compiling
+    them again.
+
+    Args:
+        simulation (callable): The simulation function, e.g. `simulation_euler` or
+            `simulation_descent_approach_euler`.
+        kwargs_list (list of dict): Keyword arguments of `load_or_run_simulation` for
+            each run. They are sent to the worker processes, so a custom pilot
+            control model must be a module-level function rather than a lambda.
+        max_workers (int, optional): Number of worker processes. Defaults to the
+            number of processors.
+
+    Returns:
+        list of dict: The results of the runs, in the order of `kwargs_list`.
+    """
+
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(load_or_run_simulation, simulation, **kwargs)
+            for kwargs in kwargs_list
+        ]
+        return [future.result() for future in futures]
@@ -1,7 +1,116 @@
+import math
+
 import numpy as np
 
 from . import ureg
-from ambiance import Atmosphere
+from ..helpers._jit import njit
+from ..helpers.isa_table import _isa, atm_at
+from .const import BPR, Max_Thrust_SE_SL
+
+# sea level pressure [Pa] and speed of sound [m/s], evaluated once at import. The ISA
+# sea level values are exact, identical to those of ambiance.
+_, _P_SL, _, _A_SL = _isa(0.0)
+
+# unit of the pint-facing fuel flow, resolved once at import, and its scale from [kg/s]
+_MG_PER_S = ureg("mg/s")
+_MG_PER_KG = 1e6
+
+
+@njit(cache=True)
+def _max_thrust_consts_si(thrust_max_sl, bpr):
+    """
+    Engine constants `(thrust_max_sl, k_z, k_x)` of the maximum thrust model: the sea
+    level thrust in [N] and the bypass ratio factors of the Z and X terms.
+    """
+
+    g_0 = 0.6375 + (0.0604 * bpr)
+    k_z = (0.377 * (1 + bpr)) / math.sqrt(g_0 * (1 + (0.82 * bpr)))
+    k_x = 0.23 + (0.19 * math.sqrt(bpr))
+    return thrust_max_sl, k_z, k_x
+
+
+@njit(cache=True)
+def _max_thrust_fixed_isa(consts, atm, mach):
+    """
+    `_max_thrust_isa` for engine constants `consts` precomputed by
+    `_max_thrust_consts_si`.
+    """
+
+    thrust_max_sl, k_z, k_x = consts
+    p_ratio = atm.p / _P_SL
+
+    # A, X and Z, the polynomials in the pressure ratio in Horner form
+    a = 0.0472 + p_ratio * (1.3855 + p_ratio * -0.4327)
+    x = p_ratio * (1.8697 + p_ratio * (-1.7736 + p_ratio * 0.9106))
+    z = p_ratio * (1.3003 + p_ratio * (-0.4374 + p_ratio * 0.1377))
+
+    return (a - (z * mach * k_z) + (k_x * x * mach**2)) * thrust_max_sl
+
+
+@njit(cache=True)
+def _max_thrust_isa(thrust_max_sl, bpr, atm, mach):
+    """
+    `_max_thrust_si` given the atmospheric state `atm` (an `isa_table.AtmState`) at
+    the current altitude instead of the altitude.
+    """
+
+    return _max_thrust_fixed_isa(_max_thrust_consts_si(thrust_max_sl, bpr), atm, mach)
+
+
+@njit(cache=True)
+def _max_thrust_si(thrust_max_sl, bpr, h, mach):
+    """
+    SI-float core of `max_thrust_model`: sea level thrust in [N], altitude in [m].
+    Returns the maximum thrust in [N].
+    """
+
+    return _max_thrust_isa(thrust_max_sl, bpr, atm_at(h), mach)
+
+
+@njit(cache=True)
+def _max_thrust_si_array(thrust_max_sl, bpr, h, mach):
+    """
+    Elementwise `_max_thrust_si` over 1-D float64 arrays of altitude [m] and Mach number,
+    with the engine constants evaluated once for all elements.
+    """
+
+    consts = _max_thrust_consts_si(thrust_max_sl, bpr)
+    out = np.empty(h.size)
+    for i in range(h.size):
+        out[i] = _max_thrust_fixed_isa(consts, atm_at(h[i]), mach[i])
+    return out
+
+
+@njit(cache=True)
+def _fuel_flow_isa(thrust, mach, atm):
+    """
+    `_fuel_flow_si` given the atmospheric state `atm` (an `isa_table.AtmState`) at
+    the current altitude instead of the altitude.
+    """
+
+    # ISA temperature ratio, from the speed of sound ratio since a ~ sqrt(T)
+    sqrt_theta = atm.a / _A_SL
+
+    # thrust specific fuel consumption of 11 mg/s /N expressed in [kg/s /N]
+    c_t = 11e-6 * (1 + mach) * sqrt_theta
+    return c_t * thrust
+
+
+@njit(cache=True)
+def _fuel_flow_si(thrust, mach, h):
+    """
+    SI-float core of `fuel_flow`: thrust in [N], altitude in [m].
+    Returns the fuel flow in [kg/s].
+    """
+
+    return _fuel_flow_isa(thrust, mach, atm_at(h))
+
+
+# engine constants of the aircraft, the engine is fixed so they are evaluated once at
+# import and the simulations call `_max_thrust_fixed_isa` with them
+_MAX_THRUST_CONSTS = _max_thrust_consts_si(
+    Max_Thrust_SE_SL.to("N").magnitude, float(BPR)
+)
 
 
 def max_thrust_model(thrust_max_sl, bpr, h, mach):
@@ -17,13 +126,14 @@ def max_thrust_model(thrust_max_sl, bpr, h, mach):
         Bypass ratio of the engine.
     h : Quantity
         Altitude as a pint Quantity with units of length (e.g., meters or feet).
-    mach : float
+    mach : float or array-like
         Mach number (dimensionless).
 
     Returns:
     --------
     float
-        Maximum thrust at the given altitude and Mach number, rounded to 4 decimal places.
+        Maximum thrust at the given altitude and Mach number.
+        Array-valued if `h` or `mach` is an array.
 
     Notes:
     ------
@@ -31,37 +141,29 @@ def max_thrust_model(thrust_max_sl, bpr, h, mach):
       intermediate parameters.
     - The calculation involves empirical coefficients and terms based on the bypass ratio,
       altitude, and Mach number.
-    - The `Atmosphere` class and `ureg` are assumed to be part of the codebase, where `Atmosphere`
-      provides atmospheric properties and `ureg` is used for unit handling.
-    - The function also uses numpy (`np`) for mathematical operations.
+    - The pressure is interpolated from the tabulated ISA model in `isa_table`, and the
+      model is evaluated in plain SI floats by `_max_thrust_si`.
+    - `h` and `mach` may be scalar or array-valued; arrays are broadcast against each other,
+      so a whole trajectory is evaluated in a single call.
     """
 
-    # compute G0
-    g_0 = 0.6375 + (0.0604 * bpr)
-
-    # compute pressures
-    p_h = Atmosphere(h.to("m").m).pressure[0] * ureg("Pa")  # pressure at altitude h
-    p_sl = Atmosphere(0).pressure[0] * ureg("Pa")  # pressure at sea level
-
-    # compute A, X, and Z
-    a = (-0.4327 * (p_h / p_sl) ** 2) + (1.3855 * (p_h / p_sl)) + 0.0472
-    x = (
-        (0.9106 * (p_h / p_sl) ** 3)
-        - (1.7736 * (p_h / p_sl) ** 2)
-        + (1.8697 * (p_h / p_sl))
-    )
-    z = (
-        (0.1377 * (p_h / p_sl) ** 3)
-        - (0.4374 * (p_h / p_sl) ** 2)
-        + (1.3003 * (p_h / p_sl))
-    )
+    # convert once at the boundary, the SI core gives the max thrust as a fraction of
+    # the sea level thrust, which carries the units of the result
+    bpr = float(bpr)
+    h = h.to("m").magnitude
+    mach = ureg.Quantity(mach).to("dimensionless").magnitude
 
-    temp_term_1 = z * mach * (0.377 * (1 + bpr)) / np.sqrt(g_0 * (1 + (0.82 * bpr)))
-    temp_term_2 = (0.23 + (0.19 * np.sqrt(bpr))) * x * mach**2
+    if np.ndim(h) == 0 and np.ndim(mach) == 0:
+        thrust_ratio = _max_thrust_si(1.0, bpr, h, mach)
+    else:
+        h, mach = np.broadcast_arrays(
+            np.asarray(h, dtype=float), np.asarray(mach, dtype=float)
+        )
+        thrust_ratio = _max_thrust_si_array(
+            1.0, bpr, np.ravel(h), np.ravel(mach)
+        ).reshape(h.shape)
 
-    thrust_max_h = (a - temp_term_1 + temp_term_2) * thrust_max_sl
-
-    return np.round(thrust_max_h, 4)
+    return thrust_ratio * thrust_max_sl
 
 
 def fuel_flow(thrust, mach, h):
@@ -78,20 +180,14 @@ def fuel_flow(thrust, mach, h):
         pint.Quantity: The fuel flow rate in milligrams per second (mg/s).
 
     Notes:
-        - The function computes the temperature ratio (theta) using the atmospheric temperature at the given altitude
-          and sea-level temperature.
-        - The thrust specific fuel consumption (TSFC) is calculated in units of mg/s per N, considering the Mach number
-          and temperature ratio.
-        - The final fuel flow is obtained by multiplying TSFC with the thrust and rounding to 4 decimal places.
+        - The function computes the temperature ratio (theta) from the tabulated ISA speed of sound at the given
+          altitude and at sea level, since the speed of sound scales with the square root of the temperature.
+        - The thrust specific fuel consumption (TSFC) of 11 mg/s per N is scaled with the Mach number and temperature
+          ratio, in plain floats in SI units by `_fuel_flow_si`.
+        - The final fuel flow is obtained by multiplying TSFC with the thrust; units are attached once to the result.
     """
 
-    # compute parameter theta
-    temp_h = Atmosphere(h.to("m").m).temperature[0] * ureg("K")
-    temp_sl = Atmosphere(0).temperature[0] * ureg("K")
-    theta = temp_h / temp_sl
-
-    # compute thrust specific fuel consumption in [mg/s /N]
-    c_t = 11 * (1 + mach) * np.sqrt(theta) * ureg("mg/s /N")
-
-    # compute and return fuel flow in [mg/s]
-    return np.round((c_t * thrust).to_reduced_units(), 4)
+    # convert once at the boundary, compute the fuel flow in [kg/s] with the SI core
+    # and return it in [mg/s]
+    m_dot = _fuel_flow_si(thrust.to("N").m, float(mach), h.to("m").m)
+    return (m_dot * _MG_PER_KG) * _MG_PER_S